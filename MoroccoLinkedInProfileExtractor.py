@@ -1,29 +1,72 @@
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from linkedin_scraper import actions
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from dotenv import load_dotenv
-import nltk
-import time
 import json
 import os
-import re
+import queue
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from rate_limiter import limiter
+from navigation import EMPTY_RESULTS, PageNavigator, RESULT_CARDS
+from page_parser import parse_search_results
+from url_index import UrlIndex, canonicalize_profile_url
+from search_strategies import build_search_strategies, strategy_stats
+from keywords import rank_keywords
+from bootstrap import chromedriver_path, ensure_nltk, lazy_import
+from metrics import instrument_driver, page_loaded, record, span
 import config
 
+webdriver = lazy_import("selenium.webdriver")
+By = lazy_import("selenium.webdriver.common.by", "By")
+actions = lazy_import("linkedin_scraper.actions")
+
 load_dotenv()
 
+# Reads every result card of the current page in one round-trip, returned as a JSON string
+SEARCH_CARDS_SCRIPT = """
+const text = (card, selector) => {
+    const el = card.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+const seen = new Set();
+const results = [];
+for (const card of document.querySelectorAll(arguments[0])) {
+    const link = card.querySelector("a[href*='/in/']");
+    if (!link) continue;
+    const url = link.href.split('?')[0];
+    if (seen.has(url)) continue;
+    seen.add(url);
+    results.push({
+        profile_url: link.href,
+        name: text(card, ".entity-result__title-text a span[aria-hidden='true']"),
+        headline: text(card, ".entity-result__primary-subtitle"),
+        location: text(card, ".entity-result__secondary-subtitle")
+    });
+}
+return JSON.stringify(results);
+"""
+
+LEAN_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--blink-settings=imagesEnabled=false"
+)
+
 class MoroccoLinkedInProfileExtractor:
     def __init__(self):
         self.driver = None
+        self.navigator = None
         self.profiles = []
+        self.url_index = UrlIndex()
+        self.seen_index = None
+        self.skip_seen = False
+        self.checkpoint = None
+        self.trace = None
+        self._profiles_lock = threading.Lock()
         self.target_locations = [loc.lower().strip() for loc in config.TARGET_LOCATIONS]
         self.email = os.getenv('LINKEDIN_EMAIL')
         self.password = os.getenv('LINKEDIN_PASSWORD')
@@ -32,21 +75,41 @@ class MoroccoLinkedInProfileExtractor:
         self.setup_nltk()
 
     def setup_nltk(self):
-        required_packages = ['punkt', 'stopwords', 'wordnet']
-        for package in required_packages:
-            try:
-                nltk.data.find(f'tokenizers/{package}')
-            except LookupError:
-                nltk.download(package, quiet=True)
+        # resources are looked up (and downloaded) once per process, not per extractor
+        ensure_nltk()
 
-    def setup_driver(self):
-        chrome_options = Options()
-        #chrome_options.add_argument("--headless=new") # run on background
+    def setup_driver(self, cache_name=None):
+        lean = config.LEAN_DRIVER
+        chrome_options = webdriver.ChromeOptions()
+        if lean or config.HEADLESS or config.HEADLESS_MODE:
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        chrome_options.add_argument(f"--window-size={config.LEAN_WINDOW_SIZE if lean else config.WINDOW_SIZE}")
+        if lean:
+            for argument in LEAN_ARGUMENTS:
+                chrome_options.add_argument(argument)
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            if cache_name:
+                # one directory per session: concurrent Chrome processes cannot share a disk cache
+                chrome_options.add_argument(f"--disk-cache-dir={os.path.join(config.BROWSER_CACHE_DIR, cache_name)}")
+                chrome_options.add_argument(f"--disk-cache-size={config.BROWSER_CACHE_SIZE}")
+        if config.NAV_WAIT_NETWORK_IDLE:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        self.driver = webdriver.Chrome(service=webdriver.ChromeService(chromedriver_path()), options=chrome_options)
+        instrument_driver(self.driver, lambda: self.trace)
+        if lean:
+            self.block_heavy_requests()
+        self.navigator = PageNavigator(self.driver)
+
+    def block_heavy_requests(self):
+        """Block fonts, media and trackers through CDP"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config.BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            print(f"⚠️ Could not trim browser requests: {e}")
 
     def login_to_linkedin(self):
         try:
@@ -58,65 +121,191 @@ class MoroccoLinkedInProfileExtractor:
             input("Press ENTER after solving the captcha...")
             return True
 
+    def start_session(self, cookies_file=None):
+        with span("driver_start", self.trace):
+            self.setup_driver(os.path.splitext(os.path.basename(cookies_file))[0] if cookies_file else None)
+        with span("login", self.trace):
+            if cookies_file and self.load_cookies(cookies_file):
+                return True
+            if not self.login_to_linkedin():
+                return False
+        if cookies_file:
+            self.save_cookies(cookies_file)
+        return True
+
+    def is_logged_in(self):
+        try:
+            current_url = self.driver.current_url
+        except WebDriverException:
+            return False
+        return not any(marker in current_url for marker in ("/login", "/authwall", "/checkpoint", "/uas/"))
+
+    def is_alive(self):
+        if self.driver is None:
+            return False
+        try:
+            self.driver.execute_script("return document.readyState")
+            return self.is_logged_in()
+        except WebDriverException:
+            return False
+
+    def load_cookies(self, cookies_file):
+        if not os.path.exists(cookies_file):
+            return False
+        try:
+            with open(cookies_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            self.driver.get(f"{config.LINKEDIN_BASE_URL}/")
+            for cookie in cookies:
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    continue
+            self.driver.get(f"{config.LINKEDIN_BASE_URL}/feed/")
+            return "/feed" in self.driver.current_url and self.is_logged_in()
+        except (OSError, ValueError, WebDriverException):
+            return False
+
+    def save_cookies(self, cookies_file):
+        try:
+            os.makedirs(os.path.dirname(cookies_file), exist_ok=True)
+            with open(cookies_file, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f)
+            return True
+        except (OSError, WebDriverException):
+            return False
+
+    def reset(self):
+        self.profiles = []
+        self.url_index = UrlIndex()
+        self.seen_index = None
+        self.skip_seen = False
+        self.checkpoint = None
+        self.trace = None
+        if self.navigator is not None:
+            self.navigator.reset()
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
     def extract_keywords(self, description):
-        stop_words = set(stopwords.words('english'))
-        lemmatizer = WordNetLemmatizer()
-        text = re.sub(r'[^a-zA-Z\s]', '', description.lower())
-        tokens = word_tokenize(text)
-        keywords = [lemmatizer.lemmatize(t) for t in tokens if t not in stop_words and len(t) > 2]
-        return list(set(keywords))[:10]
-
-    def search_morocco_profiles(self, keywords):
-        search_query = " ".join(keywords)
-        search_strategies = [
-            f"https://www.linkedin.com/search/results/people/?keywords={search_query}&geoUrn=%5B%22102787409%22%5D",
-            f"https://www.linkedin.com/search/results/people/?keywords={search_query}%20Morocco&geoUrn=%5B%22102787409%22%5D",
-            f"https://www.linkedin.com/search/results/people/?keywords={search_query}%20Maroc&geoUrn=%5B%22102787409%22%5D",
-            f"https://www.linkedin.com/search/results/people/?keywords={search_query}%20Casablanca&geoUrn=%5B%22102787409%22%5D",
-            f"https://www.linkedin.com/search/results/people/?keywords={search_query}%20Rabat&geoUrn=%5B%22102787409%22%5D",
-            f"https://www.linkedin.com/search/results/people/?keywords={search_query}%20Marrakech&geoUrn=%5B%22102787409%22%5D",
-        ]
-        profiles_found = 0
-        for search_url in search_strategies:
-            if profiles_found >= config.MAX_PROFILES:
-                break
-            profiles_found += self._search_with_url(search_url, profiles_found)
-
-    def _search_with_url(self, search_url, current_count):
-        self.driver.get(search_url)
-        time.sleep(3)
+        return rank_keywords(description, limit=10)
+
+    def search_morocco_profiles(self, keywords, pool=None):
+        strategies = strategy_stats.ordered(build_search_strategies(keywords))
+        if self.checkpoint is not None:
+            strategies = [strategy for strategy in strategies if not self.checkpoint.strategy_done(strategy[0])]
+        pending = queue.Queue()
+        for strategy in strategies:
+            pending.put(strategy)
+
+        def drain(searcher):
+            while not self.target_reached():
+                try:
+                    name, search_url = pending.get_nowait()
+                except queue.Empty:
+                    return
+                profiles_found, walked = searcher._search_with_url(search_url, sink=self, strategy=name)
+                strategy_stats.record(name, profiles_found)
+                # a walk cut short by a timeout resumes from its last recorded page
+                if walked and self.checkpoint is not None:
+                    self.checkpoint.complete_strategy(name, self.harvested_urls())
+
+        def borrowed_searcher():
+            try:
+                searcher = pool.checkout(timeout=0)
+            except Exception:
+                return
+            searcher.trace = self.trace
+            try:
+                drain(searcher)
+            finally:
+                pool.checkin(searcher)
+
+        extra = min(config.SEARCH_WORKERS, len(strategies)) - 1 if pool is not None else 0
+        if extra <= 0:
+            drain(self)
+            return
+        with ThreadPoolExecutor(max_workers=extra + 1) as executor:
+            futures = [executor.submit(borrowed_searcher) for _ in range(extra)]
+            futures.append(executor.submit(drain, self))
+            for future in futures:
+                future.result()
+
+    def target_reached(self):
+        return len(self.profiles) >= config.MAX_PROFILES
+
+    def harvested_urls(self):
+        return [p['profile_url'] for p in self.profiles]
+
+    def restore_profiles(self, urls):
+        """Seed the run with URLs harvested before a resume"""
+        for url in urls:
+            if self.url_index.add(url):
+                self.profiles.append({"profile_url": canonicalize_profile_url(url) or url})
+
+    def _search_with_url(self, search_url, sink=None, strategy=None):
+        """
+        Walk the result pages of one strategy, adding new profiles to `sink` (self by default).
+        Returns (profiles found, whether the walk ran to its end rather than timing out).
+        """
+        sink = sink or self
+        trace = sink.trace
         profiles_found = 0
-        page = 1
+        page = sink.checkpoint.strategy_page(strategy) if sink.checkpoint is not None and strategy else 1
         max_pages = 5
-        while profiles_found + current_count < config.MAX_PROFILES and page <= max_pages:
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, ".search-results-container, .search-results__list"))
-                )
-                profile_cards = self.driver.find_elements(By.CSS_SELECTOR,
-                                                          ".reusable-search__result-container, .entity-result__item, [data-chameleon-result-urn]")
-                for card in profile_cards:
-                    if profiles_found + current_count >= config.MAX_PROFILES:
+        try:
+            record("rate_limit_wait", limiter.acquire(), trace)
+            page_loaded("search", self.navigator.open(f"{search_url}&page={page}" if page > 1 else search_url), trace)
+            while not sink.target_reached() and page <= max_pages:
+                profile_cards = self.driver.find_elements(By.CSS_SELECTOR, RESULT_CARDS)
+                if not profile_cards:
+                    # LinkedIn's own "no results" banner is a genuine empty search, not throttling
+                    if not self.driver.find_elements(By.CSS_SELECTOR, EMPTY_RESULTS):
+                        limiter.throttled("empty results")
+                    break
+                limiter.healthy()
+                with span("card_extraction", trace):
+                    if config.PARSE_MODE == "offline":
+                        page_profiles = [{"profile_url": url} for url in parse_search_results(self.driver.page_source)]
+                    else:
+                        page_profiles = self.extract_search_cards() if config.BATCH_CARD_EXTRACTION else None
+                        if not page_profiles and profile_cards:
+                            page_profiles = [self.extract_profile_data(card) for card in profile_cards]
+                for profile_data in page_profiles:
+                    if sink.target_reached():
                         break
-                    profile_data = self.extract_profile_data(card)
-                    if profile_data:
-                        if not self._is_duplicate_profile(profile_data):
-                            self.profiles.append(profile_data)
-                            profiles_found += 1
+                    if profile_data and sink._add_profile(profile_data):
+                        profiles_found += 1
+                if sink.checkpoint is not None and strategy:
+                    sink.checkpoint.record_search_page(strategy, page, sink.harvested_urls())
                 try:
                     next_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']")
                     if next_button.is_enabled():
-                        next_button.click()
-                        time.sleep(3)
+                        record("rate_limit_wait", limiter.acquire(), trace)
+                        page_loaded("search", self.navigator.click_and_wait(next_button, profile_cards[0]), trace)
                         page += 1
                     else:
                         break
                 except NoSuchElementException:
                     break
-            except TimeoutException:
-                break
-        return profiles_found
+        except TimeoutException:
+            limiter.check(self.driver)
+            return profiles_found, False
+        return profiles_found, True
+
+    def extract_search_cards(self):
+        try:
+            return json.loads(self.driver.execute_script(SEARCH_CARDS_SCRIPT, RESULT_CARDS))
+        except (WebDriverException, TypeError, ValueError):
+            return None
 
     def extract_profile_data(self, card):
         try:
@@ -125,7 +314,7 @@ class MoroccoLinkedInProfileExtractor:
             for link in profile_links:
                 href = link.get_attribute('href')
                 if href and '/in/' in href:
-                    profile_url = href.split('?')[0]
+                    profile_url = href
                     break
             if not profile_url:
                 return None
@@ -133,29 +322,30 @@ class MoroccoLinkedInProfileExtractor:
         except:
             return None
 
+    def _add_profile(self, profile_data):
+        href = profile_data.get('profile_url', '')
+        if self._is_duplicate_profile(profile_data):
+            return False
+        if self.skip_seen and self.seen_index is not None and href in self.seen_index:
+            return False
+        with self._profiles_lock:
+            if self.target_reached() or not self.url_index.add(href):
+                return False
+            profile_data['profile_url'] = canonicalize_profile_url(href)
+            self.profiles.append(profile_data)
+        return True
+
     def _is_duplicate_profile(self, new_profile):
-        new_url = new_profile.get('profile_url', '').strip().lower()
-        for existing_profile in self.profiles:
-            existing_url = existing_profile.get('profile_url', '').strip().lower()
-            if new_url and existing_url and new_url == existing_url:
-                return True
-        return False
+        return new_profile.get('profile_url', '') in self.url_index
 
-    def save_to_json(self):
+    def save_to_json(self, run_id=None):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         folder_name = "urlsExtractor"
         folder_path = os.path.join(script_dir, folder_name)
 
         os.makedirs(folder_path, exist_ok=True)
 
-        base_name = "linkedin_urls_"
-        i = 1
-        while True:
-            filename = f"{base_name}{i}.json"
-            filepath = os.path.join(folder_path, filename)
-            if not os.path.exists(filepath):
-                break
-            i += 1
+        filepath = os.path.join(folder_path, f"linkedin_urls_{run_id or uuid.uuid4().hex}.json")
 
         urls = [p['profile_url'] for p in self.profiles]
         try:
@@ -165,10 +355,9 @@ class MoroccoLinkedInProfileExtractor:
         except:
             return None
 
-    def run(self, project_description):
+    def run(self, project_description, pool=None):
         keywords = self.extract_keywords(project_description)
-        self.setup_driver()
-        if not self.login_to_linkedin():
+        if self.driver is None and not self.start_session():
             return False
-        self.search_morocco_profiles(keywords)
+        self.search_morocco_profiles(keywords, pool)
         return True
@@ -0,0 +1,175 @@
+"""
+Batch extraction: many project descriptions on one session pool, one search per
+distinct keyword set and one scrape per distinct profile
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from keywords import rank_keywords
+from profile_scraper import scrape_profiles
+import config
+
+
+class BatchError(Exception):
+    pass
+
+
+def read_batch(lines):
+    """
+    Items of a JSONL workload, one project per line: {"id": ..., "description_project": ...}.
+    `description` or `title` + `body` (as in requests.jsonl) are accepted too; ids default to the line number.
+    """
+    items, ids = [], set()
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise BatchError(f"line {number}: invalid JSON ({e})")
+        if not isinstance(record, dict):
+            raise BatchError(f"line {number}: expected a JSON object")
+        description = record.get("description_project") or record.get("description") or \
+            " ".join(str(record[key]) for key in ("title", "body") if record.get(key))
+        if not description:
+            raise BatchError(f"line {number}: missing description_project")
+        item_id = str(record.get("id") or record.get("request_id") or f"{number:04d}")
+        if item_id in ids:
+            raise BatchError(f"line {number}: duplicate id {item_id!r}")
+        ids.add(item_id)
+        items.append({'id': item_id, 'description_project': description})
+    if not items:
+        raise BatchError("No project descriptions in batch")
+    if len(items) > config.BATCH_MAX_DESCRIPTIONS:
+        raise BatchError(f"Batch has {len(items)} descriptions, the limit is {config.BATCH_MAX_DESCRIPTIONS}")
+    return items
+
+
+def search_groups(items):
+    """
+    Descriptions grouped by keyword set, so identical searches run only once. Keyed by the
+    sorted set; each group keeps the ranked keywords of its first description for the query.
+    Sets that merely overlap still search separately: every strategy query holds all the keywords.
+    """
+    groups = {}
+    for item in items:
+        ranked = rank_keywords(item['description_project'], limit=10)
+        group = groups.setdefault(tuple(sorted(ranked)), {'keywords': ranked, 'items': []})
+        group['items'].append(item)
+    return groups
+
+
+def _file_name(item_id):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', item_id)
+
+
+def run_batch(items, pool, batch_id=None, cache=None, seen_index=None, store=None, skip_seen=None, max_age=None,
+              output_dir=None, trace=None, on_progress=None):
+    """
+    Search every distinct keyword set, scrape the union of harvested URLs once, and write
+    one profiles JSON per description plus a manifest.json. Returns the manifest.
+    on_progress(phase, done, total) is called as searches and profiles complete.
+    """
+    batch_id = batch_id or uuid.uuid4().hex
+    output_dir = os.path.join(output_dir or config.BATCH_OUTPUT_DIR, batch_id)
+    skip_seen = config.SKIP_SEEN_PROFILES if skip_seen is None else skip_seen
+    progress = on_progress or (lambda phase, done, total: None)
+    created_at = time.time()
+
+    groups = search_groups(items)
+    group_urls = {}
+
+    def search(key):
+        with pool.session() as extractor:
+            extractor.seen_index = seen_index
+            extractor.skip_seen = skip_seen
+            extractor.trace = trace
+            extractor.search_morocco_profiles(groups[key]['keywords'], pool)
+            return key, extractor.harvested_urls()
+
+    progress('search', 0, len(groups))
+    with ThreadPoolExecutor(max_workers=max(1, min(config.BATCH_SEARCH_WORKERS, len(groups)))) as executor:
+        for key, urls in executor.map(search, groups):
+            group_urls[key] = urls
+            progress('search', len(group_urls), len(groups))
+
+    unique_urls = list(dict.fromkeys(url for urls in group_urls.values() for url in urls))
+    profiles, failures = {}, {}
+
+    def on_profile(index, data):
+        profiles[unique_urls[index]] = data
+        if seen_index is not None:
+            seen_index.add(data['url'])
+        progress('scrape', len(profiles), len(unique_urls))
+
+    def on_failure(index, url, error):
+        failures[url] = str(error)
+
+    progress('scrape', 0, len(unique_urls))
+    hits_before = cache.hits if cache is not None else 0
+    if unique_urls:
+        with pool.session() as extractor:
+            extractor.trace = trace
+            scrape_profiles(unique_urls, extractor, pool=pool, on_profile=on_profile, cache=cache, max_age=max_age,
+                            keep_results=False, on_failure=on_failure)
+
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    for key, group in groups.items():
+        urls = group_urls[key]
+        found = [profiles[url] for url in urls if url in profiles]
+        for item in group['items']:
+            path = os.path.join(output_dir, f"{_file_name(item['id'])}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(found, f, ensure_ascii=False, indent=4)
+            job_id = f"{batch_id}-{item['id']}"
+            if store is not None:
+                _store_result(store, job_id, item, urls, found, path, created_at)
+            results.append({
+                'id': item['id'],
+                'job_id': job_id,
+                'keywords': group['keywords'],
+                'profiles': len(found),
+                'file': path
+            })
+
+    manifest = {
+        'batch_id': batch_id,
+        'created_at': created_at,
+        'finished_at': time.time(),
+        'descriptions': len(items),
+        'searches': len(groups),
+        'unique_profiles': len(unique_urls),
+        'profiles_found': len(profiles),
+        'cache_hits': cache.hits - hits_before if cache is not None else 0,
+        'failed_urls': failures,
+        'results': results
+    }
+    manifest['file'] = os.path.join(output_dir, "manifest.json")
+    with open(manifest['file'], 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=4)
+    return manifest
+
+
+def _store_result(store, job_id, item, urls, found, path, created_at):
+    """Record one description as a finished job, so /profiles/<job_id> serves it"""
+    store.save_job({
+        'id': job_id,
+        'description_project': item['description_project'],
+        'options': {'batch_item': item['id']},
+        'running': False,
+        'finished': True,
+        'current_phase': 'done',
+        'profiles_found': len(found),
+        'latest_file': path,
+        'error': None,
+        'created_at': created_at,
+        'finished_at': time.time()
+    })
+    store.save_urls(job_id, urls)
+    for position, data in enumerate(found):
+        store.add_profile(job_id, position, data)
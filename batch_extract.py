@@ -0,0 +1,62 @@
+"""
+Extract profiles for a JSONL file of project descriptions in one run
+
+    python batch_extract.py workloads.jsonl [--output-dir DIR] [--max-age SECONDS] [--skip-seen]
+"""
+
+import argparse
+import json
+import sys
+from dotenv import load_dotenv
+from batch import BatchError, read_batch, run_batch
+from driver_pool import DriverPool
+from profile_cache import ProfileCache
+from result_store import ResultStore
+from url_index import SeenIndex
+import config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("batch_file", help="JSONL, one {\"id\", \"description_project\"} per line ('-' for stdin)")
+    parser.add_argument("--output-dir", default=config.BATCH_OUTPUT_DIR, help="results go to <output-dir>/<batch id>/")
+    parser.add_argument("--batch-id", help="defaults to a random id")
+    parser.add_argument("--max-age", type=float, help="reuse cached profiles up to this many seconds old")
+    parser.add_argument("--skip-seen", action="store_true", help="only harvest profiles no earlier run has scraped")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    try:
+        if args.batch_file == "-":
+            items = read_batch(sys.stdin)
+        else:
+            with open(args.batch_file, 'r', encoding='utf-8') as f:
+                items = read_batch(f)
+    except (OSError, BatchError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    def on_progress(phase, done, total):
+        label = "keyword searches" if phase == "search" else "unique profiles"
+        print(f"   {phase}: {done}/{total} {label}", flush=True)
+
+    print(f"🚀 Batch of {len(items)} project descriptions")
+    pool = DriverPool()
+    try:
+        manifest = run_batch(items, pool, batch_id=args.batch_id, cache=ProfileCache(), seen_index=SeenIndex(),
+                             store=ResultStore(), skip_seen=True if args.skip_seen else None,
+                             max_age=args.max_age, output_dir=args.output_dir, on_progress=on_progress)
+    finally:
+        pool.close_all()
+
+    print(f"✅ {manifest['profiles_found']} unique profiles for {manifest['descriptions']} descriptions "
+          f"({manifest['searches']} searches, {manifest['cache_hits']} cache hits, "
+          f"{len(manifest['failed_urls'])} failed)")
+    print(f"📁 {manifest['file']}")
+    json.dump({item['id']: item['profiles'] for item in manifest['results']}, sys.stdout, indent=4)
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Offline benchmarks: a mock LinkedIn server and a throughput harness with a regression gate
+"""
@@ -0,0 +1,242 @@
+"""
+Local stand-in for LinkedIn serving recorded search-result and profile pages
+
+Every page is rendered from the templates in benchmarks/pages with deterministic
+synthetic members, so a run is reproducible offline. Point the extractor at it
+with config.LINKEDIN_BASE_URL.
+
+    python -m benchmarks.mock_linkedin --port 8800 --latency 0.2 --pages 5
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+import zlib
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+FIRST_NAMES = ["Youssef", "Salma", "Amine", "Imane", "Omar", "Khadija", "Mehdi", "Sara", "Hamza", "Nadia",
+               "Yassine", "Fatima", "Karim", "Meryem", "Ayoub", "Hajar"]
+LAST_NAMES = ["El Amrani", "Benali", "Tazi", "Alaoui", "Berrada", "Chraibi", "Idrissi", "Bennani",
+              "Fassi", "Lahlou", "Ouazzani", "Sqalli"]
+CITIES = ["Casablanca", "Rabat", "Marrakech", "Tangier", "Fes", "Agadir"]
+TITLES = ["Full Stack Developer", "Backend Engineer", "Frontend Developer", "Data Engineer",
+          "DevOps Engineer", "Software Architect", "Mobile Developer", "QA Engineer"]
+COMPANIES = ["OCP Group", "Maroc Telecom", "Attijariwafa Bank", "CDG Invest", "Capgemini Maroc",
+             "Orange Business", "Inwi", "Jumia"]
+SKILLS = ["React", "Node.js", "Python", "Django", "PostgreSQL", "MongoDB", "Docker", "Kubernetes",
+          "TypeScript", "Java", "Spring", "AWS"]
+SCHOOLS = ["ENSIAS", "EMI", "INPT", "ENSA Marrakech", "Université Hassan II", "Al Akhawayn University"]
+
+PROFILE_SECTIONS = {
+    "experience": "Experience",
+    "education": "Education",
+    "interests": "Interests",
+    "honors": "Honors & awards"
+}
+
+
+def _template(name):
+    with open(os.path.join(PAGES_DIR, name), 'r', encoding='utf-8') as f:
+        return Template(f.read())
+
+
+def member(index):
+    """Deterministic synthetic member number `index`"""
+    pick = random.Random(index)
+    first, last = pick.choice(FIRST_NAMES), pick.choice(LAST_NAMES)
+    title, company, city = pick.choice(TITLES), pick.choice(COMPANIES), pick.choice(CITIES)
+    skills = pick.sample(SKILLS, 4)
+    return {
+        "index": index,
+        "slug": f"{first}-{last}-{index}".lower().replace(" ", "-"),
+        "urn": f"ACoAAB{index:012d}",
+        "name": f"{first} {last}",
+        "headline": f"{title} at {company}",
+        "location": f"{city}, Casablanca-Settat, Morocco" if city == "Casablanca" else f"{city}, Morocco",
+        "open_to_work": index % 3 == 0,
+        "about": f"{title} building products with {', '.join(skills)}.",
+        "experience": [
+            [title, f"{company} · Full-time", "Jan 2021 - Present · 3 yrs", f"{city}, Morocco",
+             f"Delivered {skills[0]} and {skills[1]} services for e-commerce platforms."],
+            [pick.choice(TITLES), f"{pick.choice(COMPANIES)} · Full-time", "Sep 2017 - Dec 2020 · 3 yrs 4 mos",
+             "Rabat, Morocco", f"Worked with {skills[2]} and {skills[3]}."]
+        ],
+        "education": [[pick.choice(SCHOOLS), "Engineer's degree, Computer Science", "2012 - 2017"]],
+        "interests": [[pick.choice(COMPANIES)], [pick.choice(SCHOOLS)]],
+        "honors": [[f"{pick.choice(SKILLS)} hackathon winner"]]
+    }
+
+
+class MockLinkedIn:
+    """Page rendering and request accounting, independent of the HTTP layer"""
+
+    def __init__(self, members=200, per_page=10, pages=5, latency=0.0, jitter=0.0, seed=0):
+        self.members = members
+        self.per_page = per_page
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.base_url = ""
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._templates = {name: _template(f"{name}.html")
+                           for name in ("search", "search_card", "profile", "profile_section", "feed")}
+
+    def delay(self):
+        with self._lock:
+            self.requests += 1
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+        if self.latency or extra:
+            time.sleep(self.latency + extra)
+
+    def profile_url(self, person):
+        return f"{self.base_url}/in/{person['slug']}/"
+
+    def search_page(self, query):
+        params = {key: values[0] for key, values in parse_qs(query).items()}
+        keywords = params.get("keywords", "")
+        page = max(1, min(int(params.get("page", 1) or 1), self.pages))
+        start = zlib.crc32(keywords.encode("utf-8")) % self.members + (page - 1) * self.per_page
+        cards = []
+        for offset in range(self.per_page):
+            person = member((start + offset) % self.members)
+            cards.append(self._templates["search_card"].substitute(
+                member_id=person["index"], urn=person["urn"], url=escape(self.profile_url(person)),
+                name=escape(person["name"]), headline=escape(person["headline"]), location=escape(person["location"])
+            ))
+
+        def page_url(number):
+            return escape(f"{self.base_url}/search/results/people/?{urlencode(dict(params, page=number))}")
+
+        return self._templates["search"].substitute(
+            query=escape(keywords), total=self.pages * self.per_page, cards="\n".join(cards),
+            page=page, pages=self.pages,
+            previous_url=page_url(page - 1), previous_disabled="disabled" if page == 1 else "",
+            next_url=page_url(page + 1), next_disabled="disabled" if page == self.pages else ""
+        )
+
+    def profile_page(self, slug, section=None):
+        index = int(slug.rsplit("-", 1)[-1]) if slug.rsplit("-", 1)[-1].isdigit() else None
+        if index is None or index >= self.members or member(index)["slug"] != slug:
+            return None
+        person = member(index)
+        if section is None:
+            return self._templates["profile"].substitute(
+                member_id=index, name=escape(person["name"]), headline=escape(person["headline"]),
+                location=escape(person["location"]), about=escape(person["about"]),
+                open_to_work='title="#OPEN_TO_WORK"' if person["open_to_work"] else ""
+            )
+        if section not in PROFILE_SECTIONS:
+            return None
+        items = "\n".join(
+            '        <li class="pvs-list__paged-list-item artdeco-list__item">'
+            + "".join(f'<span aria-hidden="true">{escape(text)}</span>' for text in texts)
+            + "</li>"
+            for texts in person[section]
+        )
+        return self._templates["profile_section"].substitute(
+            title=escape(PROFILE_SECTIONS[section]), name=escape(person["name"]), items=items
+        )
+
+    def render(self, path, query):
+        """(status, html) for a request path"""
+        segments = [segment for segment in path.split("/") if segment]
+        if not segments or segments == ["feed"]:
+            return 200, self._templates["feed"].substitute()
+        if segments[:3] == ["search", "results", "people"]:
+            return 200, self.search_page(query)
+        if segments[0] == "in" and len(segments) in (2, 4) and (len(segments) == 2 or segments[2] == "details"):
+            page = self.profile_page(segments[1], segments[3] if len(segments) == 4 else None)
+            if page is not None:
+                return 200, page
+        return 404, "<html><head><title>Page not found | LinkedIn</title></head><body><main></main></body></html>"
+
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path.startswith("/static/"):
+                # images and stylesheets: answered at once so they never dominate page latency
+                self._send(200, b"", "image/jpeg" if parts.path.endswith(".jpg") else "text/css")
+                return
+            site.delay()
+            status, page = site.render(parts.path, parts.query)
+            self._send(status, page.encode("utf-8"), "text/html; charset=utf-8")
+
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+class MockLinkedInServer:
+    """MockLinkedIn served over HTTP on a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0, **options):
+        self.site = MockLinkedIn(**options)
+        self._server = ThreadingHTTPServer((host, port), make_handler(self.site))
+        self._server.daemon_threads = True
+        self.url = f"http://{host}:{self._server.server_address[1]}"
+        self.site.base_url = self.url
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-linkedin", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_arguments(parser):
+    parser.add_argument("--members", type=int, default=200, help="distinct synthetic members")
+    parser.add_argument("--per-page", type=int, default=10, help="result cards per search page")
+    parser.add_argument("--pages", type=int, default=5, help="result pages per search")
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds added to every page response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def server_options(args):
+    return {'members': args.members, 'per_page': args.per_page, 'pages': args.pages,
+            'latency': args.latency, 'jitter': args.jitter, 'seed': args.seed}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    add_arguments(parser)
+    args = parser.parse_args()
+    server = MockLinkedInServer(args.host, args.port, **server_options(args))
+    print(f"Mock LinkedIn on {server.url} (set LINKEDIN_BASE_URL to this)")
+    server.serve_forever()
@@ -0,0 +1,281 @@
+"""
+Offline throughput benchmark against the mock LinkedIn server, with a regression gate
+
+Runs the extractor (search + profile scraping) or the whole /extract pipeline
+against benchmarks/mock_linkedin.py and reports profiles/min, p50/p95 page
+latency, WebDriver commands per profile and peak RSS of the process tree
+(Python + chromedriver + Chrome). Needs a local Chrome; set CHROMEDRIVER_PATH
+to stay fully offline.
+
+    python -m benchmarks.run --mode extractor --profiles 30
+    python -m benchmarks.run --mode pipeline --compare benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --allow-missing-baseline
+    python -m benchmarks.run --update-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import config
+from benchmarks.mock_linkedin import MockLinkedInServer, add_arguments, server_options
+
+DESCRIPTION = "Full stack developer with React, Node.js, Python and PostgreSQL experience for an e-commerce platform"
+
+# higher is better for profiles_per_min, lower is better for the rest
+GATED_METRICS = {
+    'profiles_per_min': 'higher',
+    'page_latency_p95': 'lower',
+    'webdriver_calls_per_profile': 'lower',
+    'peak_rss_mb': 'lower'
+}
+DEFAULT_TOLERANCE = 0.15
+
+
+def configure(base_url, work_dir, profiles):
+    """Point every path at work_dir, the site at base_url, and lift the politeness delays"""
+    overrides = {
+        'LINKEDIN_BASE_URL': base_url,
+        'MAX_PROFILES': profiles,
+        'PARSE_MODE': 'offline',
+        'LEAN_DRIVER': True,
+        'SKIP_SEEN_PROFILES': False,
+        'DELAY_BETWEEN_PROFILES': 0.01,
+        'RATE_LIMIT_PER_MINUTE': 60000,
+        'RATE_LIMIT_MAX_PER_MINUTE': 60000,
+        'RATE_LIMIT_BURST': 1000,
+        'RATE_LIMIT_JITTER': 0,
+        'OUTPUT_DIR': os.path.join(work_dir, "linkedin_pages"),
+        'COOKIES_DIR': os.path.join(work_dir, "sessions"),
+        'BROWSER_CACHE_DIR': os.path.join(work_dir, "cache", "chrome"),
+        'PROFILE_CACHE_PATH': os.path.join(work_dir, "cache", "profiles.sqlite3"),
+        'SEEN_INDEX_PATH': os.path.join(work_dir, "cache", "seen_urls.sqlite3"),
+        'STRATEGY_STATS_PATH': os.path.join(work_dir, "cache", "strategy_stats.json"),
+        'RESULT_STORE_PATH': os.path.join(work_dir, "profilsExtractor", "results.sqlite3"),
+        'CHECKPOINT_DIR': os.path.join(work_dir, "checkpoints")
+    }
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    os.environ.setdefault("LINKEDIN_EMAIL", "benchmark@example.com")
+    os.environ.setdefault("LINKEDIN_PASSWORD", "benchmark")
+    # a stored session for every cookies file the run may open, so nothing tries the real login page
+    os.makedirs(config.COOKIES_DIR, exist_ok=True)
+    names = [f"session_{slot}" for slot in range(1, config.DRIVER_POOL_SIZE + 1)]
+    names += [f"process_worker_{n}" for n in range(1, config.PROFILE_WORKERS + 1)] + ["benchmark"]
+    for name in names:
+        with open(os.path.join(config.COOKIES_DIR, f"{name}.json"), 'w', encoding='utf-8') as f:
+            json.dump([{"name": "li_at", "value": "benchmark", "path": "/"}], f)
+
+
+def _tree_rss_bytes(root_pid):
+    """Resident memory of root_pid and all its descendants, from /proc"""
+    children, rss = {}, {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(entry))
+            rss[int(entry)] = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, IndexError, ValueError):
+            continue
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+class RssSampler:
+    """Background sampler of the peak RSS of this process and its browsers"""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _sample(self):
+        if os.path.isdir("/proc"):
+            return _tree_rss_bytes(os.getpid())
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._sample())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._sample())
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def run_extractor():
+    """Search and scrape with one extractor, outside the API"""
+    from MoroccoLinkedInProfileExtractor import MoroccoLinkedInProfileExtractor
+    from profile_scraper import scrape_profiles
+
+    extractor = MoroccoLinkedInProfileExtractor()
+    try:
+        if not extractor.start_session(os.path.join(config.COOKIES_DIR, "benchmark.json")):
+            raise RuntimeError("Could not open a session on the mock server")
+        extractor.run(DESCRIPTION)
+        return len(scrape_profiles(extractor.harvested_urls(), extractor))
+    finally:
+        extractor.close()
+
+
+def run_pipeline(timeout=600):
+    """Queue one job through POST /extract and wait for it to finish"""
+    import flask_linkedin_extractor as api
+
+    client = api.app.test_client()
+    try:
+        response = client.post('/extract', json={"description_project": DESCRIPTION})
+        if response.status_code != 202:
+            raise RuntimeError(f"/extract answered {response.status_code}: {response.get_json()}")
+        status_url = response.get_json()['status_url']
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = client.get(status_url).get_json()
+            if job['finished']:
+                if job['error']:
+                    raise RuntimeError(f"Job failed: {job['error']}")
+                return job['profiles_found']
+            time.sleep(0.2)
+        raise RuntimeError(f"Job did not finish within {timeout}s")
+    finally:
+        api.driver_pool.close_all()
+
+
+def benchmark(args):
+    with tempfile.TemporaryDirectory(prefix="linkedin-bench-") as work_dir, \
+            MockLinkedInServer(**server_options(args)) as server:
+        configure(server.url, work_dir, args.profiles)
+        os.chdir(work_dir)
+        from metrics import registry
+
+        page_latencies = []
+        registry.listen(lambda name, value, labels: page_latencies.append(value)
+                        if name == 'linkedin_phase_seconds' and labels.get('phase', '').endswith('_page_load') else None)
+
+        started = time.perf_counter()
+        with RssSampler() as rss:
+            profiles = run_pipeline() if args.mode == "pipeline" else run_extractor()
+        elapsed = time.perf_counter() - started
+        commands = registry.total('linkedin_webdriver_commands_total')
+
+        return {
+            'mode': args.mode,
+            'profiles': profiles,
+            'elapsed_seconds': round(elapsed, 3),
+            'profiles_per_min': round(profiles * 60 / elapsed, 2) if elapsed else None,
+            'pages_loaded': len(page_latencies),
+            'page_latency_p50': round(percentile(page_latencies, 0.5), 4) if page_latencies else None,
+            'page_latency_p95': round(percentile(page_latencies, 0.95), 4) if page_latencies else None,
+            'webdriver_calls': commands,
+            'webdriver_calls_per_profile': round(commands / profiles, 2) if profiles else None,
+            'peak_rss_mb': round(rss.peak / 2 ** 20, 1),
+            'server_requests': server.site.requests
+        }
+
+
+def scenario(args):
+    return dict(server_options(args), mode=args.mode, profiles=args.profiles)
+
+
+def compare(results, baseline):
+    """Regressions of results against baseline['results'], as human-readable strings"""
+    tolerances = baseline.get('tolerance', {})
+    failures = []
+    for name, direction in GATED_METRICS.items():
+        expected, actual = baseline['results'].get(name), results.get(name)
+        if expected is None or actual is None:
+            continue
+        tolerance = tolerances.get(name, DEFAULT_TOLERANCE)
+        if direction == 'higher' and actual < expected * (1 - tolerance):
+            failures.append(f"{name}: {actual} < {expected} - {tolerance:.0%}")
+        elif direction == 'lower' and actual > expected * (1 + tolerance):
+            failures.append(f"{name}: {actual} > {expected} + {tolerance:.0%}")
+    return failures
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {'tolerance': {name: DEFAULT_TOLERANCE for name in GATED_METRICS}, 'scenario': None, 'results': None}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=("extractor", "pipeline"), default="extractor")
+    parser.add_argument("--profiles", type=int, default=30, help="profiles to harvest and scrape (MAX_PROFILES)")
+    parser.add_argument("--output", help="also write the results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="exit 1 when a gated metric regressed past its tolerance")
+    parser.add_argument("--update-baseline", metavar="BASELINE", help="store these results as the new baseline")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="with --compare, pass when the baseline has no results recorded yet")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.compare or args.update_baseline) if (args.compare or args.update_baseline) else None
+
+    results = benchmark(args)
+    print(json.dumps(results, indent=4))
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+    if args.update_baseline:
+        baseline = load_baseline(baseline_path)
+        baseline.update(scenario=scenario(args), results=results)
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=4)
+            f.write("\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    if args.compare:
+        baseline = load_baseline(baseline_path)
+        if not baseline.get('results'):
+            print(f"No results recorded in {baseline_path} yet, run with --update-baseline on this host first")
+            return 0 if args.allow_missing_baseline else 1
+        if baseline.get('scenario') and baseline['scenario'] != scenario(args):
+            print(f"Warning: scenario differs from the baseline's {baseline['scenario']}")
+        failures = compare(results, baseline)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            return 1
+        print("No regression against the baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Process bootstrap: lazy heavy imports, one-time resource warm-up and startup metrics
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+import types
+from functools import lru_cache
+import config
+
+PROCESS_STARTED = time.perf_counter()
+
+logger = logging.getLogger(__name__)
+
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet'
+}
+
+startup_metrics = {
+    'cold_start_seconds': None,
+    'nltk_warmup_seconds': None,
+    'chromedriver_resolve_seconds': None,
+    'job_setup_seconds_last': None,
+    'job_setup_seconds_avg': None,
+    'jobs_setup': 0
+}
+
+_lock = threading.Lock()
+_nltk_ready = False
+_chromedriver_path = None
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that runs the real import on first attribute access"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_name'] = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__dict__['_lazy_name'])
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+class LazyAttribute:
+    """Proxy for a class or function of a lazily imported module (e.g. By, WebDriverWait)"""
+
+    def __init__(self, module_name, attr):
+        self._module_name = module_name
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module_name), self._attr)
+        return self._target
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+
+def lazy_import(name, attr=None):
+    return LazyAttribute(name, attr) if attr else LazyModule(name)
+
+
+nltk = lazy_import("nltk")
+
+
+def ensure_nltk():
+    """Look up (and download if missing) the NLTK resources once per process"""
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    with _lock:
+        if _nltk_ready:
+            return
+        started = time.perf_counter()
+        for package, resource in NLTK_RESOURCES.items():
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                nltk.download(package, quiet=True)
+        startup_metrics['nltk_warmup_seconds'] = round(time.perf_counter() - started, 3)
+        _nltk_ready = True
+
+
+@lru_cache(maxsize=1)
+def stop_words():
+    ensure_nltk()
+    return frozenset(nltk.corpus.stopwords.words('english'))
+
+
+@lru_cache(maxsize=1)
+def lemmatizer():
+    ensure_nltk()
+    return nltk.stem.WordNetLemmatizer()
+
+
+def chromedriver_path():
+    """Pinned chromedriver: CHROMEDRIVER_PATH if set, otherwise installed once per process"""
+    global _chromedriver_path
+    if _chromedriver_path:
+        return _chromedriver_path
+    with _lock:
+        if not _chromedriver_path:
+            started = time.perf_counter()
+            path = os.getenv("CHROMEDRIVER_PATH") or config.CHROMEDRIVER_PATH
+            if not path:
+                from webdriver_manager.chrome import ChromeDriverManager
+                path = ChromeDriverManager().install()
+            _chromedriver_path = path
+            startup_metrics['chromedriver_resolve_seconds'] = round(time.perf_counter() - started, 3)
+    return _chromedriver_path
+
+
+def warm_up(chromedriver=None):
+    """Load NLTK data, the stopword set and lemmatizer (and optionally chromedriver) up front"""
+    try:
+        stop_words()
+        lemmatizer().lemmatize("warmup")
+        if config.WARM_UP_CHROMEDRIVER if chromedriver is None else chromedriver:
+            chromedriver_path()
+    except Exception as e:
+        logger.warning("Warm-up failed: %s", e)
+
+
+def warm_up_in_background():
+    thread = threading.Thread(target=warm_up, name="bootstrap-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def mark_ready():
+    startup_metrics['cold_start_seconds'] = round(time.perf_counter() - PROCESS_STARTED, 3)
+
+
+def record_job_setup(seconds):
+    with _lock:
+        count = startup_metrics['jobs_setup']
+        average = startup_metrics['job_setup_seconds_avg'] or 0.0
+        startup_metrics['jobs_setup'] = count + 1
+        startup_metrics['job_setup_seconds_last'] = round(seconds, 3)
+        startup_metrics['job_setup_seconds_avg'] = round((average * count + seconds) / (count + 1), 3)
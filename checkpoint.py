@@ -0,0 +1,113 @@
+"""
+Durable per-job checkpoints so an interrupted extraction can be resumed
+"""
+
+import json
+import os
+import threading
+import time
+import config
+
+
+class JobCheckpoint:
+    def __init__(self, state, path):
+        self.state = state
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(job_id):
+        return os.path.join(config.CHECKPOINT_DIR, f"{job_id}.json")
+
+    @classmethod
+    def load(cls, job_id):
+        path = cls.path_for(job_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), path)
+
+    @classmethod
+    def create(cls, job):
+        checkpoint = cls({
+            'job_id': job['id'],
+            'description_project': job['description_project'],
+            'options': job['options'],
+            'phase': 'search',
+            'strategies': {},
+            'harvested_urls': [],
+            'completed_urls': [],
+            'failed_urls': {},
+            'updated_at': None
+        }, cls.path_for(job['id']))
+        checkpoint.save()
+        return checkpoint
+
+    def save(self):
+        """Atomically replace the checkpoint file"""
+        with self._lock:
+            self.state['updated_at'] = time.time()
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    # search cursor
+
+    def strategy_page(self, name):
+        return self.state['strategies'].get(name, {}).get('page', 1)
+
+    def strategy_done(self, name):
+        return self.state['strategies'].get(name, {}).get('done', False)
+
+    def record_search_page(self, name, page, harvested_urls):
+        with self._lock:
+            self.state['strategies'][name] = {'page': page, 'done': False}
+            self.state['harvested_urls'] = list(harvested_urls)
+        self.save()
+
+    def complete_strategy(self, name, harvested_urls):
+        with self._lock:
+            cursor = self.state['strategies'].setdefault(name, {'page': 1})
+            cursor['done'] = True
+            self.state['harvested_urls'] = list(harvested_urls)
+        self.save()
+
+    # scraping progress
+
+    def start_scraping(self, urls):
+        with self._lock:
+            self.state['phase'] = 'scrape'
+            self.state['harvested_urls'] = list(urls)
+        self.save()
+
+    def mark_completed(self, url):
+        with self._lock:
+            self.state['completed_urls'].append(url)
+            self.state['failed_urls'].pop(url, None)
+        self.save()
+
+    def mark_failed(self, url, error):
+        with self._lock:
+            failure = self.state['failed_urls'].setdefault(url, {'attempts': 0})
+            failure['attempts'] += 1
+            failure['error'] = str(error)
+        self.save()
+
+    def mark_done(self):
+        with self._lock:
+            self.state['phase'] = 'done'
+        self.save()
+
+    @property
+    def phase(self):
+        return self.state['phase']
+
+    @property
+    def harvested_urls(self):
+        return self.state['harvested_urls']
+
+    @property
+    def completed_urls(self):
+        return set(self.state['completed_urls'])
@@ -5,6 +5,7 @@ Simple Configuration for LinkedIn Profile Extractor
 import os
 
 MAX_PROFILES = 2
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
 OUTPUT_FILE = "linkedin_profiles.json"
 
 HEADLESS_MODE = False
@@ -20,5 +21,89 @@ SEARCH_LOCATION_FILTER = "Morocco"
 REQUIRE_MOROCCO_LOCATION = True
 INPUT_JSON_FILE = "profiles.json"
 OUTPUT_DIR = os.path.join(os.getcwd(), "linkedin_pages")
+BATCH_CARD_EXTRACTION = True  # read all search cards with one execute_script call
+PARSE_MODE = "live"  # "live": linkedin_scraper.Person, "offline": save page_source to OUTPUT_DIR and parse with lxml
 HEADLESS = False
-DELAY_BETWEEN_PROFILES = 3  # seconds
+DELAY_BETWEEN_PROFILES = 3  # seconds, per profile worker
+
+# Browser
+WINDOW_SIZE = "1920,1080"
+LEAN_DRIVER = False  # headless, no images/fonts/media/trackers, small viewport, persistent disk cache
+# (headless cannot show the captcha prompt: log in once with LEAN_DRIVER off so session cookies exist)
+LEAN_WINDOW_SIZE = "1280,800"  # still wide enough for the desktop search result cards
+BROWSER_CACHE_DIR = os.path.join(os.getcwd(), "cache", "chrome")  # one subdirectory per browser session
+BROWSER_CACHE_SIZE = 200 * 1024 * 1024  # bytes
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*/dms/playlist/*",
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com/li.lms-analytics*", "*bat.bing.com*", "*facebook.net*"
+]
+
+# Job queue
+JOB_WORKERS = 2
+JOB_QUEUE_SIZE = 20
+JOB_HISTORY_LIMIT = 100
+STREAM_KEEPALIVE = 15  # seconds between keep-alive lines on idle streams
+
+# Driver pool
+DRIVER_POOL_SIZE = 4  # JOB_WORKERS * PROFILE_WORKERS
+DRIVER_IDLE_TIMEOUT = 900  # seconds
+DRIVER_CHECKOUT_TIMEOUT = 600  # seconds
+COOKIES_DIR = os.path.join(os.getcwd(), "sessions")
+
+# Profile scraping
+PROFILE_WORKERS = 2
+PROFILE_WORKER_BACKEND = "thread"  # "thread" or "process" (no driver pool: a fresh Chrome and login per worker, every job)
+PROFILE_MAX_RETRIES = 2
+PROFILE_RETRY_BACKOFF = 10  # seconds, doubled on each retry
+
+# Rate limiting (shared by every driver and job, process-backend workers included)
+RATE_LIMIT_PER_MINUTE = 20  # page loads; a profile costs one per page it opens
+RATE_LIMIT_MIN_PER_MINUTE = 4
+RATE_LIMIT_MAX_PER_MINUTE = 40
+RATE_LIMIT_BURST = 3
+RATE_LIMIT_JITTER = 0.3  # fraction of one token interval
+RATE_LIMIT_BACKOFF = 0.5  # rate multiplier on captcha / empty results
+RATE_LIMIT_RECOVERY = 1  # requests/min regained per healthy response
+RATE_LIMIT_COOLDOWN = 30  # seconds paused after a throttling signal
+
+# Navigation
+NAV_TIMEOUT = 10  # seconds
+NAV_POLL_INTERVAL = 0.1  # seconds
+NAV_WAIT_NETWORK_IDLE = False  # also wait for network idle (CDP performance log)
+NAV_NETWORK_IDLE_TIME = 0.5  # seconds without in-flight requests
+
+# Profile cache
+PROFILE_CACHE_PATH = os.path.join(os.getcwd(), "cache", "profiles.sqlite3")
+PROFILE_CACHE_TTL = 7 * 24 * 3600  # seconds
+PROFILE_CACHE_MAX_ENTRIES = 5000
+
+# URL deduplication
+SEEN_INDEX_PATH = os.path.join(os.getcwd(), "cache", "seen_urls.sqlite3")
+SKIP_SEEN_PROFILES = False  # default of the per-request skip_seen option: skip profiles scraped by earlier jobs and keep paginating
+
+# Search
+SEARCH_WORKERS = 3  # strategies searched concurrently, each on its own pooled driver
+STRATEGY_STATS_PATH = os.path.join(os.getcwd(), "cache", "strategy_stats.json")
+
+# Result store
+RESULT_STORE_PATH = os.path.join(os.getcwd(), "profilsExtractor", "results.sqlite3")
+SEARCH_MAX_PER_PAGE = 100
+
+# Checkpoints
+CHECKPOINT_DIR = os.path.join(os.getcwd(), "checkpoints")
+
+# Relevance ranking (BM25)
+RANKING_K1 = 1.5
+RANKING_B = 0.75
+RANKING_DEFAULT_LIMIT = 50
+
+# Startup
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")  # pinned driver binary; None resolves it once with webdriver_manager
+WARM_UP_CHROMEDRIVER = False  # also resolve chromedriver during the startup warm-up
+
+# Batch extraction
+BATCH_MAX_DESCRIPTIONS = 500
+BATCH_SEARCH_WORKERS = 2  # distinct keyword searches run at once, each on a pooled session
+BATCH_OUTPUT_DIR = os.path.join(os.getcwd(), "profilsExtractor", "batches")
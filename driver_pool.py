@@ -0,0 +1,135 @@
+"""
+Pool of warm, logged-in Selenium sessions shared by extraction jobs
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from MoroccoLinkedInProfileExtractor import MoroccoLinkedInProfileExtractor
+import config
+
+
+class DriverPoolExhausted(Exception):
+    pass
+
+
+class DriverPool:
+    def __init__(self, size=None, idle_timeout=None, cookies_dir=None, factory=MoroccoLinkedInProfileExtractor):
+        self.size = size or config.DRIVER_POOL_SIZE
+        self.idle_timeout = idle_timeout or config.DRIVER_IDLE_TIMEOUT
+        self.cookies_dir = cookies_dir or config.COOKIES_DIR
+        self.factory = factory
+        self._idle = []
+        self._free_slots = list(range(self.size, 0, -1))
+        self._cond = threading.Condition()
+        self._reaper = None
+
+    def cookies_file(self, slot):
+        return os.path.join(self.cookies_dir, f"session_{slot}.json")
+
+    def checkout(self, timeout=None):
+        """Borrow a healthy logged-in extractor, starting one if a slot is free"""
+        timeout = config.DRIVER_CHECKOUT_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        self._start_reaper()
+        with self._cond:
+            while not self._idle and not self._free_slots:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DriverPoolExhausted(f"No browser session available after {timeout}s")
+                self._cond.wait(remaining)
+            if self._idle:
+                extractor, _ = self._idle.pop()
+            else:
+                extractor = None
+                slot = self._free_slots.pop()
+
+        if extractor is not None and not extractor.is_alive():
+            slot = extractor.pool_slot
+            extractor.close()
+            extractor = None
+
+        if extractor is None:
+            try:
+                extractor = self._create(slot)
+            except Exception:
+                self._release_slot(slot)
+                raise
+
+        extractor.reset()
+        return extractor
+
+    def checkin(self, extractor, discard=False):
+        """Return an extractor to the pool, or close it when it is broken"""
+        if not discard and extractor.is_alive():
+            extractor.save_cookies(self.cookies_file(extractor.pool_slot))
+            with self._cond:
+                self._idle.append((extractor, time.monotonic()))
+                self._cond.notify()
+            return
+        extractor.close()
+        self._release_slot(extractor.pool_slot)
+
+    @contextmanager
+    def session(self, timeout=None):
+        extractor = self.checkout(timeout)
+        try:
+            yield extractor
+        except Exception:
+            self.checkin(extractor, discard=not extractor.is_alive())
+            raise
+        else:
+            self.checkin(extractor)
+
+    def evict_idle(self):
+        """Close sessions that have not been used for idle_timeout seconds"""
+        now = time.monotonic()
+        with self._cond:
+            expired = [item for item in self._idle if now - item[1] >= self.idle_timeout]
+            self._idle = [item for item in self._idle if now - item[1] < self.idle_timeout]
+        for extractor, _ in expired:
+            extractor.close()
+            self._release_slot(extractor.pool_slot)
+        return len(expired)
+
+    def close_all(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for extractor, _ in idle:
+            extractor.close()
+            self._release_slot(extractor.pool_slot)
+
+    def stats(self):
+        with self._cond:
+            return {
+                'size': self.size,
+                'idle': len(self._idle),
+                'in_use': self.size - len(self._idle) - len(self._free_slots),
+                'free_slots': len(self._free_slots)
+            }
+
+    def _create(self, slot):
+        extractor = self.factory()
+        extractor.pool_slot = slot
+        if not extractor.start_session(self.cookies_file(slot)):
+            extractor.close()
+            raise RuntimeError("LinkedIn login failed")
+        return extractor
+
+    def _release_slot(self, slot):
+        with self._cond:
+            self._free_slots.append(slot)
+            self._cond.notify()
+
+    def _start_reaper(self):
+        with self._cond:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap, name="driver-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self):
+        while True:
+            time.sleep(max(self.idle_timeout / 4, 1))
+            self.evict_idle()
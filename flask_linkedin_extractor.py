@@ -1,15 +1,27 @@
+import bootstrap
 from flask_cors import CORS
-from linkedin_scraper import Person
-from MoroccoLinkedInProfileExtractor import MoroccoLinkedInProfileExtractor
+from driver_pool import DriverPool
+from profile_scraper import scrape_profiles
+from profile_cache import ProfileCache
+from url_index import SeenIndex
+from result_writer import ResultWriter, read_records
+from result_store import ResultStore
+from checkpoint import JobCheckpoint
+from batch import BatchError, read_batch, run_batch
+from ranking import StoreRanker
+from job_queue import JobQueue, JobQueueFull
+from metrics import JobTrace, registry, span
+from rate_limiter import limiter
 from dotenv import load_dotenv
-from flask import Flask, Response, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
+import atexit
 import os
 import sys
 import logging
-import threading
-import time
 import json
-import random
+import math
+import queue
+import time
 import config
 
 SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), 'scripts')
@@ -21,17 +33,6 @@ load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 
-extraction_status = {
-    'running': False,
-    'progress': 0,
-    'total': 0,
-    'current_phase': 'idle',
-    'message': 'Ready to start',
-    'profiles_found': 0,
-    'latest_file': None,
-    'error': None
-}
-
 HTML_DIR = "linkedin_pages"
 
 
@@ -42,153 +43,273 @@ def home():
         'message': 'Morocco LinkedIn Profile Extractor API',
         'endpoints': {
             '/': 'This documentation',
-            '/extract': 'Start profile extraction (POST)',
-            '/status': 'Check extraction status'
+            '/extract': 'Queue a profile extraction job (POST, ?stream=1 for NDJSON events)',
+            '/extract/batch': 'Queue one job for a JSONL file of project descriptions (POST, ?max_age=&skip_seen=)',
+            '/status': 'Check the job queue status',
+            '/status/<job_id>': 'Check the status of one extraction job',
+            '/profiles': 'Display the last extracted profiles',
+            '/profiles/<job_id>': 'Display the profiles extracted by one job',
+            '/profiles/search': 'Search stored profiles (?location=&skills=a,b&company=&open_to_work=&page=&per_page=)',
+            '/profiles/rank': 'Rank stored profiles against a project description (POST)',
+            '/jobs/<job_id>/stream': 'Server-Sent Events stream of one job',
+            '/jobs/<job_id>/resume': 'Resume an interrupted job from its checkpoint (POST)',
+            '/metrics': 'Prometheus metrics: phase timings, page loads, profiles, captchas, WebDriver commands'
         },
         'version': '1.0.0'
     })
 
 @app.route('/status')
 def get_status():
-    """Get current extraction status"""
-    return jsonify(extraction_status)
+    """Get the job queue and browser pool status"""
+    status = job_queue.summary()
+    status['drivers'] = driver_pool.stats()
+    status['profile_cache'] = profile_cache.stats()
+    status['startup'] = bootstrap.startup_metrics
+    return jsonify(status)
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus metrics for the scraper process"""
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/status/<job_id>')
+def get_job_status(job_id):
+    """Get the status of one extraction job"""
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
+    return jsonify(job)
+
+def run_extraction_process(job):
+    trace = JobTrace()
+    try:
+        job.update({
+            'current_phase': 'waiting_for_driver',
+            'message': 'Waiting for a browser session...'
+        })
+        started = time.perf_counter()
+        with driver_pool.session() as extractor:
+            job['setup_seconds'] = round(time.perf_counter() - started, 3)
+            bootstrap.record_job_setup(job['setup_seconds'])
+            trace.add('driver_checkout', job['setup_seconds'])
+            extractor.trace = trace
+            extract_with_session(job, extractor)
+    except Exception as e:
+        job.update({
+            'running': False,
+            'error': str(e),
+            'current_phase': 'error'
+        })
+    finally:
+        job['timings'] = trace.summary()
+
+def run_job(job):
+    if 'batch' in job['options']:
+        run_batch_process(job)
+    else:
+        run_extraction_process(job)
+
+def run_batch_process(job):
+    """Run a /extract/batch job: shared pool, merged searches, one scrape per unique profile"""
+    trace = JobTrace()
+    options = job['options']
+
+    def on_progress(phase, done, total):
+        job.update({
+            'current_phase': 'extraction' if phase == 'search' else 'scraping',
+            'message': f"{'Searched' if phase == 'search' else 'Scraped'} {done}/{total} "
+                       f"{'distinct keyword sets' if phase == 'search' else 'unique profiles'}",
+            'total': total,
+            'progress': int(done * 100 / max(total, 1))
+        })
+        if phase == 'scrape':
+            job['profiles_found'] = done
+        publish_progress(job, trace)
 
-def run_extraction_process(description_project):
-    global extraction_status
     try:
-        extraction_status.update({
+        manifest = run_batch(options['batch'], driver_pool, batch_id=job['id'], cache=profile_cache,
+                             seen_index=seen_index, store=result_store, skip_seen=options.get('skip_seen'),
+                             max_age=options.get('max_age'), trace=trace, on_progress=on_progress)
+        job.update({
+            'running': False,
+            'profiles_found': manifest['profiles_found'],
+            'manifest_file': manifest['file'],
+            'batch_results': manifest['results'],
+            'current_phase': 'done',
+            'message': f"Extracted {manifest['profiles_found']} unique profiles for {manifest['descriptions']} "
+                       f"descriptions with {manifest['searches']} searches",
+            'progress': 100
+        })
+    except Exception as e:
+        job.update({
+            'running': False,
+            'error': str(e),
+            'current_phase': 'error'
+        })
+    finally:
+        job['timings'] = trace.summary()
+
+def extract_with_session(job, extractor):
+    description_project = job['description_project']
+    checkpoint = JobCheckpoint.load(job['id']) or JobCheckpoint.create(job)
+    extractor.checkpoint = checkpoint
+
+    if checkpoint.phase == 'search':
+        job.update({
             'current_phase': 'extraction',
             'message': 'Extracting LinkedIn profiles...'
         })
 
-        extractor = MoroccoLinkedInProfileExtractor()
-        success = extractor.run(description_project)
+        extractor.seen_index = seen_index
+        extractor.skip_seen = job['options'].get('skip_seen', config.SKIP_SEEN_PROFILES)
+        extractor.restore_profiles(checkpoint.harvested_urls)
+        success = extractor.run(description_project, pool=driver_pool)
 
         if not success:
-            extraction_status.update({
+            job.update({
                 'running': False,
                 'error': 'Profile extraction failed',
                 'current_phase': 'error'
             })
             return
 
-        url_file = extractor.save_to_json()
+        job['search_page_loads'] = extractor.navigator.summary()
+
+        url_file = extractor.save_to_json(job['id'])
         if not url_file:
-            extraction_status.update({
+            job.update({
                 'running': False,
                 'error': 'Failed to save extracted URLs',
                 'current_phase': 'error'
             })
             return
 
-        with open(url_file, 'r', encoding='utf-8') as f:
-            linkedin_urls = json.load(f)
-
-        profiles_data = []
+        linkedin_urls = extractor.harvested_urls()
+        checkpoint.start_scraping(linkedin_urls)
+    else:
+        linkedin_urls = checkpoint.harvested_urls
+    result_store.save_urls(job['id'], linkedin_urls)
+
+    output_dir = "profilsExtractor"
+    writer = ResultWriter(os.path.join(output_dir, f"linkedin_profiles_{job['id']}.ndjson"))
+    job.update({
+        'current_phase': 'scraping',
+        'message': f'Scraping {len(linkedin_urls)} profiles...',
+        'total': len(linkedin_urls),
+        'ndjson_file': writer.path,
+        'profiles_found': writer.count,
+        'profiles_failed': 0
+    })
+    publish_progress(job, extractor.trace)
+
+    def on_profile(index, data):
+        with span('persist', extractor.trace):
+            writer.append(index, data)
+            checkpoint.mark_completed(linkedin_urls[index])
+            result_store.add_profile(job['id'], index, data)
+            seen_index.add(data['url'])
+        job['profiles_found'] += 1
+        job['progress'] = int(job['profiles_found'] * 100 / max(len(linkedin_urls), 1))
+        job_queue.publish(job['id'], {'event': 'profile', 'index': index, 'profile': data})
+        publish_progress(job, extractor.trace)
+
+    def on_failure(index, url, error):
+        checkpoint.mark_failed(url, error)
+        job['profiles_failed'] += 1
+
+    hits_before = profile_cache.hits
+    try:
+        scrape_profiles(linkedin_urls, extractor, pool=driver_pool, on_profile=on_profile, cache=profile_cache,
+                        max_age=job['options'].get('max_age'), keep_results=False,
+                        on_failure=on_failure, skip_urls=checkpoint.completed_urls)
+    finally:
+        writer.close()
+    job['cache_hits'] = profile_cache.hits - hits_before
+
+    # Save full profiles JSON
+    filename = os.path.join(output_dir, f"linkedin_profiles_{job['id']}.json")
+    with span('persist', extractor.trace):
+        profiles_count = writer.finalize(filename)
+    # with failures left the checkpoint stays in the scrape phase, so a resume retries them
+    if not checkpoint.state['failed_urls']:
+        checkpoint.mark_done()
+
+    job.update({
+        'running': False,
+        'profiles_found': profiles_count,
+        'latest_file': filename,
+        'current_phase': 'done',
+        'message': f'Extracted {profiles_count} profiles',
+        'progress': 100
+    })
 
-        def safe_get(obj, attr, default="N/A"):
-            try:
-                return getattr(obj, attr) if getattr(obj, attr, None) else default
-            except Exception:
-                return default
+def publish_progress(job, trace=None):
+    if trace is not None:
+        job['timings'] = trace.summary()
+    job_queue.publish(job['id'], {
+        'event': 'progress',
+        'current_phase': job['current_phase'],
+        'progress': job['progress'],
+        'profiles_found': job['profiles_found'],
+        'total': job['total']
+    })
 
-        for url in linkedin_urls:
+def job_events(job):
+    """Profiles already written for the job, then live progress/profile events until it finishes"""
+    events = job_queue.subscribe(job['id'])
+    try:
+        replayed = set()
+        for record in read_records(job.get('ndjson_file')):
+            replayed.add(record['index'])
+            yield {'event': 'profile', 'index': record['index'], 'profile': record['profile']}
+        if job['finished']:
+            yield {'event': 'error' if job['error'] else 'done', 'status': dict(job)}
+            return
+        while True:
             try:
-                person = Person(url, driver=extractor.driver, scrape=True, close_on_complete=False)
-            except Exception:
+                event = events.get(timeout=config.STREAM_KEEPALIVE)
+            except queue.Empty:
+                yield None
                 continue
-
-            unique_educations = []
-            seen_edu = set()
-            for edu in person.educations:
-                edu_tuple = (
-                    safe_get(edu, "institution_name"),
-                    safe_get(edu, "degree"),
-                    safe_get(edu, "from_date"),
-                    safe_get(edu, "to_date"),
-                    safe_get(edu, "description")
-                )
-                if edu_tuple not in seen_edu:
-                    seen_edu.add(edu_tuple)
-                    unique_educations.append({
-                        "institution": edu_tuple[0],
-                        "degree": edu_tuple[1],
-                        "from": edu_tuple[2],
-                        "to": edu_tuple[3],
-                        "description": edu_tuple[4]
-                    })
-
-            data = {
-                "url": url,
-                "profile": {
-                    "name": safe_get(person, "name"),
-                    "location": safe_get(person, "location"),
-                    "about": safe_get(person, "about"),
-                    "open_to_work": safe_get(person, "open_to_work")
-                },
-                "experiences": [{
-                    "title": safe_get(exp, "position_title"),
-                    "company": safe_get(exp, "institution_name"),
-                    "from": safe_get(exp, "from_date"),
-                    "to": safe_get(exp, "to_date"),
-                    "description": safe_get(exp, "description")
-                } for exp in person.experiences],
-                "educations": unique_educations,
-                "interests": [safe_get(interest, "name") for interest in person.interests],
-                "accomplishments": [{
-                    "category": safe_get(acc, "category"),
-                    "title": safe_get(acc, "title")
-                } for acc in person.accomplishments],
-                "contacts": [{
-                    "name": safe_get(contact, "name"),
-                    "occupation": safe_get(contact, "occupation"),
-                    "url": safe_get(contact, "url")
-                } for contact in person.contacts]
-            }
-
-            profiles_data.append(data)
-            time.sleep(random.randint(5, 10))
-
-        # Save full profiles JSON
-        output_dir = "profilsExtractor"
-        os.makedirs(output_dir, exist_ok=True)
-        i = 1
-        while True:
-            filename = os.path.join(output_dir, f"linkedin_profiles_{i}.json")
-            if not os.path.exists(filename):
-                break
-            i += 1
-
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(profiles_data, f, ensure_ascii=False, indent=4)
-
-        extractor.driver.quit()
-
-        extraction_status.update({
-            'running': False,
-            'profiles_found': len(profiles_data),
-            'latest_file': filename,
-            'progress': 100
-        })
-
-    except Exception as e:
-        extraction_status.update({
-            'running': False,
-            'error': str(e),
-            'current_phase': 'error'
-        })
+            if event['event'] == 'profile' and event['index'] in replayed:
+                continue
+            yield event
+            if event['event'] in ('done', 'error'):
+                return
+    finally:
+        job_queue.unsubscribe(job['id'], events)
+
+def ndjson_stream(job):
+    for event in job_events(job):
+        yield "\n" if event is None else json.dumps(event, ensure_ascii=False) + "\n"
+
+def sse_stream(job):
+    for event in job_events(job):
+        if event is None:
+            yield ": keepalive\n\n"
+        else:
+            yield f"event: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+driver_pool = DriverPool()
+profile_cache = ProfileCache()
+seen_index = SeenIndex()
+result_store = ResultStore()
+ranker = StoreRanker(result_store)
+job_queue = JobQueue(run_job, store=result_store)
+atexit.register(driver_pool.close_all)
+registry.gauge('linkedin_jobs', 'Extraction jobs by state',
+               lambda: {state: job_queue.summary()[state] for state in ('queued', 'running', 'finished')})
+registry.gauge('linkedin_drivers', 'Pooled browser sessions by state',
+               lambda: {state: driver_pool.stats()[state] for state in ('idle', 'in_use', 'free_slots')})
+registry.gauge('linkedin_rate_limit_per_minute', 'Current shared request rate', lambda: round(limiter.rate * 60, 3))
+bootstrap.warm_up_in_background()
+bootstrap.mark_ready()
 
 
 @app.route('/extract', methods=['POST'])
 def start_extraction():
-    global extraction_status
-
-    if extraction_status['running']:
-        return jsonify({
-            'error': 'Extraction already in progress',
-            'status': extraction_status
-        }), 400
-
+    """Queue an extraction job and return its id right away"""
     email = os.getenv("LINKEDIN_EMAIL")
     password = os.getenv("LINKEDIN_PASSWORD")
     if not email or not password:
@@ -197,58 +318,216 @@ def start_extraction():
             'message': 'Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD'
         }), 400
 
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data or "description_project" not in data:
         return jsonify({"error": "Missing description_project in request body"}), 400
 
-    description_project = data["description_project"]
-
-    extraction_status.update({
-        'running': True,
-        'progress': 0,
-        'total': config.MAX_PROFILES,
-        'current_phase': 'starting',
-        'message': 'Initializing extraction...',
-        'profiles_found': 0,
-        'latest_file': None,
-        'error': None
-    })
+    max_age = data.get("max_age")
+    if max_age is not None and (isinstance(max_age, bool) or not isinstance(max_age, (int, float))
+                                or not math.isfinite(max_age) or max_age < 0):
+        return jsonify({"error": "max_age must be a non-negative number of seconds"}), 400
+    skip_seen = data.get("skip_seen", config.SKIP_SEEN_PROFILES)
+    if not isinstance(skip_seen, bool):
+        return jsonify({"error": "skip_seen must be true or false"}), 400
 
-    thread = threading.Thread(target=run_extraction_process, args=(description_project,))
-    thread.start()
-    thread.join()
+    try:
+        job = job_queue.submit(data["description_project"], max_age=max_age, skip_seen=skip_seen)
+    except JobQueueFull as e:
+        return jsonify({
+            'error': str(e),
+            'message': 'Please retry later'
+        }), 503
 
-    latest_file = extraction_status.get('latest_file')
-    if latest_file and os.path.exists(latest_file):
-        with open(latest_file, "r", encoding="utf-8") as f:
-            raw_json = f.read()
-        return Response(raw_json, mimetype='application/json')
-    else:
+    if request.args.get('stream') in ('1', 'true'):
+        return Response(stream_with_context(ndjson_stream(job)), mimetype='application/x-ndjson')
+
+    return jsonify({
+        'job_id': job['id'],
+        'stream_url': f"/jobs/{job['id']}/stream",
+        'status_url': f"/status/{job['id']}",
+        'profiles_url': f"/profiles/{job['id']}",
+        'status': job
+    }), 202
+
+@app.route('/extract/batch', methods=['POST'])
+def start_batch_extraction():
+    """Queue one job for a JSONL batch of project descriptions (request body or a `file` upload)"""
+    if not os.getenv("LINKEDIN_EMAIL") or not os.getenv("LINKEDIN_PASSWORD"):
         return jsonify({
-            'error': 'Scraping finished but no JSON file was created',
-            'status': extraction_status
-        })
+            'error': 'LinkedIn credentials not found in .env file',
+            'message': 'Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD'
+        }), 400
+
+    upload = request.files.get('file')
+    try:
+        text = upload.read().decode('utf-8') if upload else request.get_data(as_text=True)
+        items = read_batch(text.splitlines())
+    except UnicodeDecodeError:
+        return jsonify({"error": "Batch file must be UTF-8 encoded JSONL"}), 400
+    except BatchError as e:
+        return jsonify({"error": str(e)}), 400
+
+    max_age = request.args.get('max_age')
+    try:
+        max_age = None if max_age is None else float(max_age)
+    except ValueError:
+        return jsonify({"error": "max_age must be a non-negative number of seconds"}), 400
+    if max_age is not None and (not math.isfinite(max_age) or max_age < 0):
+        return jsonify({"error": "max_age must be a non-negative number of seconds"}), 400
+    skip_seen = request.args.get('skip_seen')
+    if skip_seen is not None and skip_seen not in ('1', 'true', '0', 'false'):
+        return jsonify({"error": "skip_seen must be true or false"}), 400
+    skip_seen = config.SKIP_SEEN_PROFILES if skip_seen is None else skip_seen in ('1', 'true')
+
+    try:
+        job = job_queue.submit(f"Batch of {len(items)} project descriptions", batch=items, max_age=max_age,
+                               skip_seen=skip_seen)
+    except JobQueueFull as e:
+        return jsonify({
+            'error': str(e),
+            'message': 'Please retry later'
+        }), 503
+
+    return jsonify({
+        'job_id': job['id'],
+        'descriptions': len(items),
+        'stream_url': f"/jobs/{job['id']}/stream",
+        'status_url': f"/status/{job['id']}",
+        'profiles_url': f"/profiles/{job['id']}",
+        'status': job
+    }), 202
 
 @app.route('/profiles', methods=['GET'])
 def get_last_profiles():
-    """Return the last saved profiles JSON file"""
-    latest_file = extraction_status.get('latest_file')
+    """Return the profiles of the last finished job"""
+    latest_job = job_queue.latest_finished() or result_store.latest_job()
+    if not latest_job:
+        return jsonify({"error": "No extracted profiles found"}), 404
+    return job_profiles_response(latest_job)
+
+@app.route('/profiles/search', methods=['GET'])
+def search_profiles():
+    """Search stored profiles by location, skills, company and open_to_work"""
+    try:
+        page = max(int(request.args.get('page', 1)), 1)
+        per_page = min(max(int(request.args.get('per_page', 20)), 1), config.SEARCH_MAX_PER_PAGE)
+    except ValueError:
+        return jsonify({"error": "page and per_page must be integers"}), 400
+
+    open_to_work = request.args.get('open_to_work')
+    skills = [skill.strip() for skill in request.args.get('skills', '').split(',') if skill.strip()]
+    return jsonify(result_store.search(
+        location=request.args.get('location'),
+        skills=skills,
+        company=request.args.get('company'),
+        open_to_work=None if open_to_work is None else open_to_work.lower() in ('1', 'true', 'yes'),
+        page=page,
+        per_page=per_page
+    ))
+
+@app.route('/profiles/rank', methods=['POST'])
+def rank_profiles():
+    """Rank stored profiles (or one job's profiles) against a project description"""
+    data = request.get_json(silent=True)
+    if not data or "description_project" not in data:
+        return jsonify({"error": "Missing description_project in request body"}), 400
+
+    limit = data.get("limit", config.RANKING_DEFAULT_LIMIT)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        return jsonify({"error": "limit must be a positive integer"}), 400
 
-    if not latest_file or not os.path.exists(latest_file):
-        folder = "profilsExtractor"
-        if not os.path.exists(folder):
-            return jsonify({"error": "No profiles folder found"}), 404
+    ranked = ranker.rank(data["description_project"], limit=limit, job_id=data.get("job_id"))
+    return jsonify({
+        'keywords': ranker.index().keywords(data["description_project"]),
+        'total': len(ranked),
+        'results': ranked
+    })
 
-        files = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".json")]
-        if not files:
-            return jsonify({"error": "No profiles JSON file found"}), 404
+@app.route('/profiles/<job_id>', methods=['GET'])
+def get_job_profiles(job_id):
+    """Return the profiles extracted by one job"""
+    job = job_queue.get(job_id) or result_store.get_job(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
 
-        latest_file = max(files, key=os.path.getmtime)
+    if not job['finished']:
+        return jsonify({
+            'message': 'Extraction still in progress',
+            'status': job
+        }), 202
 
-    with open(latest_file, "r", encoding="utf-8") as f:
-        raw_json = f.read()
+    return job_profiles_response(job)
 
-    return Response(raw_json, mimetype="application/json")
+def job_profiles_response(job):
+    if job.get('batch_results') is not None:
+        return batch_profiles_response(job)
+    latest_file = job.get('latest_file')
+    if latest_file and os.path.exists(latest_file):
+        with open(latest_file, "r", encoding="utf-8") as f:
+            raw_json = f.read()
+        return Response(raw_json, mimetype="application/json")
+
+    profiles = result_store.job_profiles(job['id'])
+    if not profiles:
+        return jsonify({
+            'error': 'Scraping finished but no profiles were stored',
+            'status': job
+        }), 404
+    return jsonify(profiles)
+
+def batch_profiles_response(job):
+    """Profiles of a batch job, keyed by description id"""
+    profiles = {}
+    for result in job['batch_results']:
+        if os.path.exists(result['file']):
+            with open(result['file'], "r", encoding="utf-8") as f:
+                profiles[result['id']] = json.load(f)
+        else:
+            profiles[result['id']] = result_store.job_profiles(result['job_id'])
+    return jsonify(profiles)
+
+@app.route('/jobs/<job_id>/resume', methods=['POST'])
+def resume_job(job_id):
+    """Restart an interrupted job from its last checkpoint"""
+    job = job_queue.get(job_id)
+    if job and not job['finished']:
+        return jsonify({'error': 'Job is still queued or running', 'status': job}), 409
+
+    checkpoint = JobCheckpoint.load(job_id)
+    if not checkpoint:
+        return jsonify({'error': 'No checkpoint found for this job', 'job_id': job_id}), 404
+    if checkpoint.phase == 'done':
+        return jsonify({'error': 'Job already completed', 'job_id': job_id}), 409
+
+    try:
+        job = job_queue.submit(checkpoint.state['description_project'], job_id=job_id, **checkpoint.state['options'])
+    except JobQueueFull as e:
+        return jsonify({
+            'error': str(e),
+            'message': 'Please retry later'
+        }), 503
+
+    return jsonify({
+        'job_id': job_id,
+        'resumed_from': {
+            'phase': checkpoint.phase,
+            'harvested_urls': len(checkpoint.harvested_urls),
+            'completed_urls': len(checkpoint.completed_urls),
+            'failed_urls': len(checkpoint.state['failed_urls'])
+        },
+        'status_url': f"/status/{job_id}",
+        'stream_url': f"/jobs/{job_id}/stream",
+        'status': job
+    }), 202
+
+@app.route('/jobs/<job_id>/stream', methods=['GET'])
+def stream_job(job_id):
+    """Server-Sent Events stream of a job's profiles and progress"""
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
+    return Response(stream_with_context(sse_stream(job)), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 # Error handlers
 @app.errorhandler(404)
@@ -257,7 +536,8 @@ def not_found():
         'error': 'Endpoint not found',
         'message': 'Please check the URL and try again',
         'available_endpoints': [
-            '/', '/extract', '/status', '/profiles', '/config', '/health'
+            '/', '/extract', '/extract/batch', '/status', '/status/<job_id>', '/profiles', '/profiles/<job_id>', '/profiles/search',
+            '/profiles/rank', '/jobs/<job_id>/stream', '/jobs/<job_id>/resume', '/metrics'
         ]
     }), 404
 
@@ -279,9 +559,17 @@ if __name__ == '__main__':
     print("🚀 Starting Flask server...")
     print("📡 API Endpoints:")
     print("   GET  /           - API documentation")
-    print("   POST /extract    - Start extraction process")
-    print("   GET  /status     - Check extraction status")
-    print("   GET  /profiles   - display last extracted profiles")
+    print("   POST /extract            - Queue an extraction job")
+    print("   POST /extract/batch      - Queue a JSONL batch of project descriptions")
+    print("   GET  /status             - Check the job queue")
+    print("   GET  /status/<job_id>    - Check one extraction job")
+    print("   GET  /profiles           - display last extracted profiles")
+    print("   GET  /profiles/<job_id>  - display profiles of one job")
+    print("   GET  /profiles/search    - search stored profiles")
+    print("   POST /profiles/rank      - rank stored profiles for a project")
+    print("   GET  /jobs/<job_id>/stream - stream profiles of one job (SSE)")
+    print("   POST /jobs/<job_id>/resume - resume an interrupted job")
+    print("   GET  /metrics            - Prometheus metrics")
     print("=" * 63)
     
     app.run(
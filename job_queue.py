@@ -0,0 +1,156 @@
+"""
+Background job queue for LinkedIn profile extraction requests
+"""
+
+import queue
+import threading
+import time
+import uuid
+import config
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class JobQueue:
+    def __init__(self, handler, workers=None, max_size=None, history_limit=None, store=None):
+        self.handler = handler
+        self.store = store
+        self.workers = workers or config.JOB_WORKERS
+        self.history_limit = history_limit or config.JOB_HISTORY_LIMIT
+        self.jobs = {}
+        self._queue = queue.Queue(maxsize=max_size or config.JOB_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._threads = []
+        self._subscribers = {}
+
+    def start(self):
+        """Start the worker threads (only once per process)"""
+        with self._lock:
+            if self._threads:
+                return
+            for n in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"extraction-worker-{n + 1}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, description_project, job_id=None, **options):
+        """Queue an extraction job (a new one, or job_id again to resume it) and return its status dict"""
+        self.start()
+        job = {
+            'id': job_id or uuid.uuid4().hex,
+            'description_project': description_project,
+            'options': options,
+            'running': False,
+            'finished': False,
+            'progress': 0,
+            'total': config.MAX_PROFILES,
+            'current_phase': 'queued',
+            'message': 'Waiting for a free worker...',
+            'profiles_found': 0,
+            'latest_file': None,
+            'error': None,
+            'created_at': time.time(),
+            'started_at': None,
+            'finished_at': None
+        }
+        with self._lock:
+            # registered before it is queued: a worker may pick the id up immediately
+            previous = self.jobs.get(job['id'])
+            self.jobs[job['id']] = job
+            try:
+                self._queue.put_nowait(job['id'])
+            except queue.Full:
+                if previous is None:
+                    del self.jobs[job['id']]
+                else:
+                    self.jobs[job['id']] = previous
+                raise JobQueueFull(f"Job queue is full ({self._queue.maxsize} pending jobs)")
+            self._prune()
+        if self.store is not None:
+            self.store.save_job(job)
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def subscribe(self, job_id):
+        """Queue receiving every event published for job_id from now on"""
+        events = queue.Queue()
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(events)
+        return events
+
+    def unsubscribe(self, job_id, events):
+        with self._lock:
+            subscribers = self._subscribers.get(job_id, [])
+            if events in subscribers:
+                subscribers.remove(events)
+            if not subscribers:
+                self._subscribers.pop(job_id, None)
+
+    def publish(self, job_id, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(job_id, []))
+        for events in subscribers:
+            events.put(event)
+
+    def latest_finished(self):
+        finished = [job for job in list(self.jobs.values()) if job['finished'] and job['latest_file']]
+        if not finished:
+            return None
+        return max(finished, key=lambda job: job['finished_at'])
+
+    def summary(self):
+        jobs = list(self.jobs.values())
+        return {
+            'workers': self.workers,
+            'queued': sum(1 for job in jobs if job['current_phase'] == 'queued'),
+            'running': sum(1 for job in jobs if job['running']),
+            'finished': sum(1 for job in jobs if job['finished']),
+            'jobs': [{
+                'id': job['id'],
+                'current_phase': job['current_phase'],
+                'progress': job['progress'],
+                'profiles_found': job['profiles_found'],
+                'error': job['error']
+            } for job in jobs]
+        }
+
+    def _prune(self):
+        finished = sorted((job for job in self.jobs.values() if job['finished']),
+                          key=lambda job: job['finished_at'])
+        while len(self.jobs) > self.history_limit and finished:
+            self.jobs.pop(finished.pop(0)['id'], None)
+
+    def _worker(self):
+        while True:
+            job_id = self._queue.get()
+            job = self.jobs.get(job_id)
+            try:
+                if job is None:
+                    continue
+                job.update({
+                    'running': True,
+                    'current_phase': 'starting',
+                    'message': 'Initializing extraction...',
+                    'started_at': time.time()
+                })
+                self.handler(job)
+            except Exception as e:
+                job.update({
+                    'error': str(e),
+                    'current_phase': 'error'
+                })
+            finally:
+                if job is not None:
+                    job.update({
+                        'running': False,
+                        'finished': True,
+                        'finished_at': time.time()
+                    })
+                    if self.store is not None:
+                        self.store.save_job(job)
+                    self.publish(job_id, {'event': 'error' if job['error'] else 'done', 'status': dict(job)})
+                self._queue.task_done()
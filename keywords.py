@@ -0,0 +1,32 @@
+"""
+Tokenization and deterministic keyword selection for project descriptions
+"""
+
+import re
+from collections import Counter
+from bootstrap import lazy_import, lemmatizer, stop_words
+
+word_tokenize = lazy_import("nltk.tokenize", "word_tokenize")
+
+
+def tokenize(text):
+    """Lowercased, lemmatized tokens without stopwords or words shorter than 3 letters"""
+    stop, lemmatize = stop_words(), lemmatizer().lemmatize
+    text = re.sub(r'[^a-zA-Z\s]', '', (text or "").lower())
+    return [lemmatize(t) for t in word_tokenize(text) if t not in stop and len(t) > 2]
+
+
+def rank_keywords(description, limit=10, idf=None):
+    """
+    Keywords of description ranked by weight: term frequency, times idf[term] when
+    corpus statistics are given. Ties keep the order of first appearance, so the
+    same description always yields the same search terms.
+    """
+    tokens = tokenize(description)
+    counts = Counter(tokens)
+    first_seen = {}
+    for position, token in enumerate(tokens):
+        first_seen.setdefault(token, position)
+    weight = {term: count * (idf.get(term, 1.0) if idf else 1.0) for term, count in counts.items()}
+    ranked = sorted(counts, key=lambda term: (-weight[term], first_seen[term]))
+    return ranked[:limit] if limit else ranked
@@ -0,0 +1,182 @@
+"""
+Process-wide counters and timing spans, exported in the Prometheus text format
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+DURATION_BUCKETS = (0.005, 0.025, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+METRICS = {
+    'linkedin_phase_seconds': ('histogram', 'Time spent in each scrape phase'),
+    'linkedin_pages_loaded_total': ('counter', 'Pages loaded, by kind (search, profile)'),
+    'linkedin_profiles_scraped_total': ('counter', 'Profiles scraped, by source (scrape, cache)'),
+    'linkedin_profiles_failed_total': ('counter', 'Profiles still failing after retries'),
+    'linkedin_captcha_events_total': ('counter', 'Captcha, authwall or empty-result throttling signals, by reason'),
+    'linkedin_webdriver_commands_total': ('counter', 'WebDriver commands sent, by command'),
+    'linkedin_webdriver_command_seconds': ('histogram', 'WebDriver command latency, by command')
+}
+
+
+def _labels(labels, extra=None):
+    pairs = list(labels) + (list(extra.items()) if extra else [])
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._gauges = {}
+        self._listeners = []
+
+    def listen(self, callback):
+        """Call callback(name, value, labels) on every histogram observation (e.g. to keep raw samples)"""
+        self._listeners.append(callback)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'buckets': [0] * len(DURATION_BUCKETS), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if value <= bound:
+                    histogram['buckets'][i] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+        for callback in self._listeners:
+            callback(name, value, labels)
+
+    def total(self, name):
+        """Sum of a counter over all its label values"""
+        with self._lock:
+            return sum(value for (metric, _), value in self._counters.items() if metric == name)
+
+    def gauge(self, name, help_text, collect):
+        """Register a gauge read at scrape time; collect() returns a number or {label value: number}"""
+        self._gauges[name] = (help_text, collect)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: dict(value, buckets=list(value['buckets'])) for key, value in self._histograms.items()}
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            if kind == 'counter':
+                lines += [f"{name}{_labels(labels)} {value}"
+                          for (metric, labels), value in sorted(counters.items()) if metric == name]
+                continue
+            for (metric, labels), histogram in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(DURATION_BUCKETS, histogram['buckets']):
+                    lines.append(f"{name}_bucket{_labels(labels, {'le': bound})} {count}")
+                lines.append(f"{name}_bucket{_labels(labels, {'le': '+Inf'})} {histogram['count']}")
+                lines.append(f"{name}_sum{_labels(labels)} {round(histogram['sum'], 6)}")
+                lines.append(f"{name}_count{_labels(labels)} {histogram['count']}")
+        for name, (help_text, collect) in self._gauges.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            value = collect()
+            if isinstance(value, dict):
+                lines += [f"{name}{_labels([('state', key)])} {number}" for key, number in value.items()]
+            else:
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class JobTrace:
+    """Per-job timing breakdown: total seconds and count per phase, plus plain counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases = {}
+        self.counters = {}
+
+    def add(self, phase, seconds):
+        with self._lock:
+            entry = self.phases.setdefault(phase, {'count': 0, 'seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += seconds
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, snapshot):
+        """Fold in the summary() of a trace recorded in another process"""
+        with self._lock:
+            for phase, entry in snapshot['phases'].items():
+                mine = self.phases.setdefault(phase, {'count': 0, 'seconds': 0.0})
+                mine['count'] += entry['count']
+                mine['seconds'] += entry['seconds']
+            for name, amount in snapshot['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self):
+        with self._lock:
+            return {
+                'phases': {phase: {'count': entry['count'], 'seconds': round(entry['seconds'], 3)}
+                           for phase, entry in sorted(self.phases.items(), key=lambda item: -item[1]['seconds'])},
+                'counters': {name: round(value, 3) if isinstance(value, float) else value
+                             for name, value in self.counters.items()}
+            }
+
+
+registry = Registry()
+
+
+def record(phase, seconds, trace=None):
+    registry.observe('linkedin_phase_seconds', seconds, phase=phase)
+    if trace is not None:
+        trace.add(phase, seconds)
+
+
+@contextmanager
+def span(phase, trace=None):
+    """Time the enclosed block as `phase`, globally and in the job's trace"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - started, trace)
+
+
+def page_loaded(kind, seconds, trace=None):
+    registry.inc('linkedin_pages_loaded_total', kind=kind)
+    record(f"{kind}_page_load", seconds, trace)
+    if trace is not None:
+        trace.count(f"{kind}_pages")
+
+
+def instrument_driver(driver, trace_of=lambda: None):
+    """Count and time every WebDriver command (element calls go through driver.execute too)"""
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            elapsed = time.perf_counter() - started
+            registry.inc('linkedin_webdriver_commands_total', command=driver_command)
+            registry.observe('linkedin_webdriver_command_seconds', elapsed, command=driver_command)
+            trace = trace_of()
+            if trace is not None:
+                trace.count('webdriver_commands')
+                trace.count('webdriver_seconds', elapsed)
+
+    driver.execute = timed_execute
+    return driver
@@ -0,0 +1,118 @@
+"""
+Event-driven page navigation: wait for real readiness signals instead of fixed sleeps
+"""
+
+import json
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from bootstrap import lazy_import
+import config
+
+By = lazy_import("selenium.webdriver.common.by", "By")
+EC = lazy_import("selenium.webdriver.support.expected_conditions")
+WebDriverWait = lazy_import("selenium.webdriver.support.ui", "WebDriverWait")
+
+RESULT_CARDS = ".reusable-search__result-container, .entity-result__item, [data-chameleon-result-urn]"
+EMPTY_RESULTS = ".search-reusable-search-no-results, .artdeco-empty-state"
+
+
+def results_ready(driver):
+    """Result cards, or LinkedIn's empty-state banner, are in the DOM"""
+    return EC.presence_of_element_located((By.CSS_SELECTOR, f"{RESULT_CARDS}, {EMPTY_RESULTS}"))(driver)
+
+
+def page_changed(old_url, old_card):
+    """
+    The previous first card was detached. LinkedIn pushes `&page=N` before the new
+    cards render, so the URL change is only used when there is no card to watch.
+    """
+    def condition(driver):
+        if old_card is not None:
+            return EC.staleness_of(old_card)(driver)
+        return driver.current_url != old_url
+    return condition
+
+
+class PageNavigator:
+    def __init__(self, driver, timeout=None, network_idle=None):
+        self.driver = driver
+        self.timeout = timeout or config.NAV_TIMEOUT
+        self.network_idle = config.NAV_WAIT_NETWORK_IDLE if network_idle is None else network_idle
+        self.page_loads = []
+
+    def open(self, url, ready=results_ready):
+        """Navigate to url and wait until `ready` holds. Returns the load time in seconds."""
+        self._drain_performance_log()
+        started = time.perf_counter()
+        self.driver.get(url)
+        self._wait(ready)
+        return self._record(url, started)
+
+    def click_and_wait(self, element, old_card=None, ready=results_ready):
+        """Click a pagination control and wait for the next page to replace the current one"""
+        old_url = self.driver.current_url
+        self._drain_performance_log()
+        started = time.perf_counter()
+        element.click()
+        self._wait(page_changed(old_url, old_card), network_idle=False)
+        self._wait(ready)
+        return self._record(self.driver.current_url, started)
+
+    def wait_for_network_idle(self, idle_time=None, timeout=None):
+        """
+        Wait until no request has been in flight for idle_time seconds, using the
+        CDP Network events from Chrome's performance log.
+        """
+        idle_time = idle_time or config.NAV_NETWORK_IDLE_TIME
+        deadline = time.monotonic() + (timeout or self.timeout)
+        in_flight = set()
+        quiet_since = time.monotonic()
+        while time.monotonic() < deadline:
+            try:
+                entries = self.driver.get_log("performance")
+            except WebDriverException:
+                return False
+            for entry in entries:
+                message = json.loads(entry["message"])["message"]
+                method = message.get("method")
+                request_id = message.get("params", {}).get("requestId")
+                if method == "Network.requestWillBeSent":
+                    in_flight.add(request_id)
+                elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                    in_flight.discard(request_id)
+            if in_flight:
+                quiet_since = time.monotonic()
+            elif time.monotonic() - quiet_since >= idle_time:
+                return True
+            time.sleep(config.NAV_POLL_INTERVAL)
+        return False
+
+    def summary(self):
+        times = [load['seconds'] for load in self.page_loads]
+        if not times:
+            return {'pages': 0, 'avg_seconds': None, 'max_seconds': None}
+        return {
+            'pages': len(times),
+            'avg_seconds': round(sum(times) / len(times), 3),
+            'max_seconds': round(max(times), 3)
+        }
+
+    def reset(self):
+        self.page_loads = []
+
+    def _drain_performance_log(self):
+        if self.network_idle:
+            try:
+                self.driver.get_log("performance")
+            except WebDriverException:
+                pass
+
+    def _wait(self, condition, network_idle=True):
+        WebDriverWait(self.driver, self.timeout, poll_frequency=config.NAV_POLL_INTERVAL).until(condition)
+        if network_idle and self.network_idle and not self.wait_for_network_idle():
+            raise TimeoutException("Network did not go idle")
+
+    def _record(self, url, started):
+        seconds = time.perf_counter() - started
+        self.page_loads.append({'url': url, 'seconds': seconds})
+        return seconds
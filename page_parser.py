@@ -0,0 +1,176 @@
+"""
+Save LinkedIn pages once and parse them offline with lxml
+"""
+
+import json
+import os
+import sys
+from lxml import html
+from bootstrap import lazy_import
+import config
+
+By = lazy_import("selenium.webdriver.common.by", "By")
+EC = lazy_import("selenium.webdriver.support.expected_conditions")
+
+PROFILE_SECTIONS = {
+    "main": "",
+    "experience": "details/experience/",
+    "education": "details/education/",
+    "interests": "details/interests/",
+    "accomplishments": "details/honors/"
+}
+
+SEARCH_CARDS = ("//*[contains(@class, 'reusable-search__result-container') or "
+                "contains(@class, 'entity-result__item') or @data-chameleon-result-urn]")
+LIST_ITEMS = "//main//section//ul/li[contains(@class, 'pvs-list__paged-list-item') or contains(@class, 'artdeco-list__item')]"
+
+
+def profile_slug(url):
+    return url.split('?')[0].rstrip('/').split('/')[-1].lower()
+
+
+def main_ready(driver):
+    return EC.presence_of_element_located((By.CSS_SELECTOR, "main"))(driver)
+
+
+def capture_profile(extractor, url, output_dir=None):
+    """Fetch every profile section once and save its page_source. Returns the profile folder."""
+    folder = os.path.join(output_dir or config.OUTPUT_DIR, profile_slug(url))
+    os.makedirs(folder, exist_ok=True)
+    base_url = url.split('?')[0].rstrip('/') + '/'
+    for section, suffix in PROFILE_SECTIONS.items():
+        extractor.navigator.open(base_url + suffix, ready=main_ready)
+        with open(os.path.join(folder, f"{section}.html"), 'w', encoding='utf-8') as f:
+            f.write(extractor.driver.page_source)
+    with open(os.path.join(folder, "url.txt"), 'w', encoding='utf-8') as f:
+        f.write(url)
+    return folder
+
+
+def _text(nodes, default="N/A"):
+    for node in nodes:
+        value = " ".join(node.text_content().split())
+        if value:
+            return value
+    return default
+
+
+def _load(folder, section):
+    path = os.path.join(folder, f"{section}.html")
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return html.fromstring(f.read())
+
+
+def _item_texts(item):
+    texts = [" ".join(t.split()) for t in item.xpath(".//span[@aria-hidden='true']/text()")]
+    return [t for t in texts if t]
+
+
+def _split_dates(value):
+    dates = value.split(" · ")[0]
+    if " - " in dates:
+        start, end = dates.split(" - ", 1)
+        return start.strip(), end.strip()
+    return (dates.strip() or "N/A"), "N/A"
+
+
+def parse_main(tree):
+    if tree is None:
+        return {"name": "N/A", "location": "N/A", "about": "N/A", "open_to_work": "N/A"}
+    return {
+        "name": _text(tree.xpath("//main//h1")),
+        "location": _text(tree.xpath("//main//span[contains(@class, 'text-body-small') and contains(@class, 'inline')]")),
+        "about": _text(tree.xpath("//div[@id='about']/ancestor::section[1]"
+                                  "//div[contains(@class, 'inline-show-more-text')]//span[@aria-hidden='true']")),
+        "open_to_work": bool(tree.xpath("//img[contains(@title, '#OPEN_TO_WORK')]")) or "N/A"
+    }
+
+
+def parse_experiences(tree):
+    experiences = []
+    for item in tree.xpath(LIST_ITEMS) if tree is not None else []:
+        texts = _item_texts(item)
+        if not texts:
+            continue
+        start, end = _split_dates(texts[2]) if len(texts) > 2 else ("N/A", "N/A")
+        experiences.append({
+            "title": texts[0],
+            "company": texts[1].split(" · ")[0] if len(texts) > 1 else "N/A",
+            "from": start,
+            "to": end,
+            "description": texts[4] if len(texts) > 4 else "N/A"
+        })
+    return experiences
+
+
+def parse_educations(tree):
+    educations = []
+    seen = set()
+    for item in tree.xpath(LIST_ITEMS) if tree is not None else []:
+        texts = _item_texts(item)
+        if not texts:
+            continue
+        start, end = _split_dates(texts[2]) if len(texts) > 2 else ("N/A", "N/A")
+        education = {
+            "institution": texts[0],
+            "degree": texts[1] if len(texts) > 1 else "N/A",
+            "from": start,
+            "to": end,
+            "description": texts[3] if len(texts) > 3 else "N/A"
+        }
+        key = tuple(education.values())
+        if key not in seen:
+            seen.add(key)
+            educations.append(education)
+    return educations
+
+
+def parse_profile(folder, url=None):
+    """Build the same profile dict as profile_scraper.scrape_profile from saved pages"""
+    if url is None:
+        with open(os.path.join(folder, "url.txt"), 'r', encoding='utf-8') as f:
+            url = f.read().strip()
+    interests = _load(folder, "interests")
+    accomplishments = _load(folder, "accomplishments")
+    return {
+        "url": url,
+        "profile": parse_main(_load(folder, "main")),
+        "experiences": parse_experiences(_load(folder, "experience")),
+        "educations": parse_educations(_load(folder, "education")),
+        "interests": [_item_texts(item)[0] for item in (interests.xpath(LIST_ITEMS) if interests is not None else [])
+                      if _item_texts(item)],
+        "accomplishments": [{
+            "category": "Honors & awards",
+            "title": _item_texts(item)[0]
+        } for item in (accomplishments.xpath(LIST_ITEMS) if accomplishments is not None else []) if _item_texts(item)],
+        "contacts": []
+    }
+
+
+def parse_search_results(page_source):
+    """Profile hrefs (with their tracking query) of the result cards in a saved search page"""
+    tree = html.fromstring(page_source)
+    hrefs = {}
+    for card in tree.xpath(SEARCH_CARDS):
+        links = card.xpath(".//a[contains(@href, '/in/')]/@href")
+        if links:
+            hrefs.setdefault(links[0].split('?')[0], links[0])
+    return list(hrefs.values())
+
+
+def reparse_saved_profiles(output_dir=None):
+    """Parse every profile folder saved under output_dir without touching the network"""
+    output_dir = output_dir or config.OUTPUT_DIR
+    profiles = []
+    for name in sorted(os.listdir(output_dir)):
+        folder = os.path.join(output_dir, name)
+        if os.path.exists(os.path.join(folder, "url.txt")):
+            profiles.append(parse_profile(folder))
+    return profiles
+
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else config.OUTPUT_DIR
+    json.dump(reparse_saved_profiles(target), sys.stdout, ensure_ascii=False, indent=4)
@@ -0,0 +1,74 @@
+"""
+On-disk cache of scraped profiles keyed by canonical profile URL
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from url_index import canonicalize_profile_url
+import config
+
+
+class ProfileCache:
+    def __init__(self, path=None, ttl=None, max_entries=None):
+        self.path = path or config.PROFILE_CACHE_PATH
+        self.ttl = ttl or config.PROFILE_CACHE_TTL
+        self.max_entries = max_entries or config.PROFILE_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                url TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS profiles_accessed_at ON profiles (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS profiles_fetched_at ON profiles (fetched_at)")
+        self._conn.commit()
+
+    def get(self, url, max_age=None):
+        """Return the cached profile dict, or None when missing or older than max_age/ttl seconds"""
+        max_age = self.ttl if max_age is None else min(max_age, self.ttl)
+        key = canonicalize_profile_url(url) or url
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT data, fetched_at FROM profiles WHERE url = ?", (key,)).fetchone()
+            if row is None or now - row[1] > max_age:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE profiles SET accessed_at = ? WHERE url = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url, data):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (url, data, fetched_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (canonicalize_profile_url(url) or url, json.dumps(data, ensure_ascii=False), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+        return {'entries': entries, 'max_entries': self.max_entries, 'hits': self.hits, 'misses': self.misses}
+
+    def _evict(self):
+        """Drop entries past the ttl, then the least recently used ones above max_entries"""
+        self._conn.execute("DELETE FROM profiles WHERE fetched_at < ?", (time.time() - self.ttl,))
+        self._conn.execute("""
+            DELETE FROM profiles WHERE url IN (
+                SELECT url FROM profiles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
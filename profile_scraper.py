@@ -0,0 +1,298 @@
+"""
+Profile scraping with fan-out across several browser workers
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from rate_limiter import RemoteLimiter, TokenBucket, limiter, serve_limiter
+from page_parser import PROFILE_SECTIONS, capture_profile, parse_profile
+from bootstrap import lazy_import
+from metrics import JobTrace, page_loaded, record, registry, span
+import config
+
+Person = lazy_import("linkedin_scraper", "Person")
+
+PERSON_SECTIONS = ("get_name_and_location", "get_about", "get_experiences", "get_educations")
+# pages Person loads per profile: the profile, its experience and education details, the profile again,
+# then the connections page
+PERSON_PAGE_LOADS = 5
+
+
+def safe_get(obj, attr, default="N/A"):
+    try:
+        return getattr(obj, attr) if getattr(obj, attr, None) else default
+    except Exception:
+        return default
+
+
+def scrape_profile(extractor, url):
+    """Scrape one LinkedIn profile into the structured dict returned by the API"""
+    trace = extractor.trace
+    if config.PARSE_MODE == "offline":
+        started = time.perf_counter()
+        folder = capture_profile(extractor, url)
+        page_loaded("profile", time.perf_counter() - started, trace)
+        with span("profile_parse", trace):
+            return parse_profile(folder, url)
+
+    started = time.perf_counter()
+    person = Person(url, driver=extractor.driver, scrape=False, close_on_complete=False)
+    page_loaded("profile", time.perf_counter() - started, trace)
+    for section in PERSON_SECTIONS:
+        setattr(person, section, _timed_section(getattr(person, section), section, trace))
+    with span("profile_scrape", trace):
+        person.scrape(close_on_complete=False)
+
+    unique_educations = []
+    seen_edu = set()
+    for edu in person.educations:
+        edu_tuple = (
+            safe_get(edu, "institution_name"),
+            safe_get(edu, "degree"),
+            safe_get(edu, "from_date"),
+            safe_get(edu, "to_date"),
+            safe_get(edu, "description")
+        )
+        if edu_tuple not in seen_edu:
+            seen_edu.add(edu_tuple)
+            unique_educations.append({
+                "institution": edu_tuple[0],
+                "degree": edu_tuple[1],
+                "from": edu_tuple[2],
+                "to": edu_tuple[3],
+                "description": edu_tuple[4]
+            })
+
+    return {
+        "url": url,
+        "profile": {
+            "name": safe_get(person, "name"),
+            "location": safe_get(person, "location"),
+            "about": safe_get(person, "about"),
+            "open_to_work": safe_get(person, "open_to_work")
+        },
+        "experiences": [{
+            "title": safe_get(exp, "position_title"),
+            "company": safe_get(exp, "institution_name"),
+            "from": safe_get(exp, "from_date"),
+            "to": safe_get(exp, "to_date"),
+            "description": safe_get(exp, "description")
+        } for exp in person.experiences],
+        "educations": unique_educations,
+        "interests": [safe_get(interest, "name") for interest in person.interests],
+        "accomplishments": [{
+            "category": safe_get(acc, "category"),
+            "title": safe_get(acc, "title")
+        } for acc in person.accomplishments],
+        "contacts": [{
+            "name": safe_get(contact, "name"),
+            "occupation": safe_get(contact, "occupation"),
+            "url": safe_get(contact, "url")
+        } for contact in person.contacts]
+    }
+
+
+def _timed_section(method, section, trace):
+    def timed(*args, **kwargs):
+        with span(f"profile_section_{section[len('get_'):]}", trace):
+            return method(*args, **kwargs)
+    return timed
+
+
+def partition(urls, workers):
+    """Split urls into `workers` interleaved (index, url) chunks"""
+    return [[(i, url) for i, url in enumerate(urls) if i % workers == n] for n in range(workers)]
+
+
+def worker_budget():
+    """Per-worker token bucket, layered under the shared limiter"""
+    return TokenBucket(1 / config.DELAY_BETWEEN_PROFILES, jitter=config.RATE_LIMIT_JITTER)
+
+
+def profile_page_loads():
+    """Page loads one profile scrape costs; the shared limiter is charged one token per page"""
+    return len(PROFILE_SECTIONS) if config.PARSE_MODE == "offline" else PERSON_PAGE_LOADS
+
+
+def paced_scrape(extractor, url, budget, shared=None):
+    """Scrape url within the worker's budget, retrying failures with exponential backoff"""
+    shared = shared or limiter
+    for attempt in range(config.PROFILE_MAX_RETRIES + 1):
+        record("rate_limit_wait", budget.acquire() + shared.acquire(profile_page_loads()), extractor.trace)
+        try:
+            data = scrape_profile(extractor, url)
+        except Exception:
+            shared.check(extractor.driver)
+            if attempt == config.PROFILE_MAX_RETRIES:
+                raise
+            with span("retry_backoff", extractor.trace):
+                time.sleep(config.PROFILE_RETRY_BACKOFF * 2 ** attempt)
+        else:
+            shared.observe(extractor.driver)
+            return data
+
+
+def scrape_profiles(urls, extractor, pool=None, workers=None, backend=None, on_profile=None, cache=None, max_age=None,
+                    keep_results=True, on_failure=None, skip_urls=None):
+    """
+    Scrape every url and return the profiles in the same order as urls.
+    `extractor` is the caller's own session; extra workers borrow sessions from `pool`.
+    Profiles found in `cache` (no older than max_age seconds) are not scraped again,
+    urls in skip_urls are left out, and urls still failing after retries go to on_failure(index, url, error).
+    With keep_results=False nothing is accumulated and profiles only reach on_profile.
+    """
+    results = [None] * len(urls) if keep_results else None
+    skip_urls = skip_urls or set()
+
+    def collect(index, data):
+        if results is not None:
+            results[index] = data
+        if on_profile:
+            on_profile(index, data)
+
+    pending = []
+    for index, url in enumerate(urls):
+        if url in skip_urls:
+            continue
+        cached = cache.get(url, max_age) if cache is not None else None
+        if cached is not None:
+            registry.inc('linkedin_profiles_scraped_total', source="cache")
+            collect(index, cached)
+        else:
+            pending.append((index, url))
+
+    def report(position, data, error):
+        index, url = pending[position]
+        if error is not None:
+            registry.inc('linkedin_profiles_failed_total')
+            if on_failure:
+                on_failure(index, url, error)
+            return
+        registry.inc('linkedin_profiles_scraped_total', source="scrape")
+        if cache is not None:
+            cache.put(url, data)
+        collect(index, data)
+
+    if pending:
+        pending_urls = [url for _, url in pending]
+        workers = max(1, min(workers or config.PROFILE_WORKERS, len(pending_urls)))
+        backend = backend or config.PROFILE_WORKER_BACKEND
+        if backend == "process" and workers > 1:
+            _scrape_with_processes(pending_urls, workers, report, extractor.trace)
+        else:
+            _scrape_with_threads(pending_urls, extractor, pool, workers, report)
+
+    return [data for data in results if data is not None] if results is not None else []
+
+
+def _scrape_with_threads(urls, extractor, pool, workers, report):
+    pending = queue.Queue()
+    for item in enumerate(urls):
+        pending.put(item)
+    lock = threading.Lock()
+
+    def drain(worker_extractor):
+        budget = worker_budget()
+        while True:
+            try:
+                index, url = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                data, error = paced_scrape(worker_extractor, url, budget), None
+            except Exception as e:
+                data, error = None, e
+            with lock:
+                report(index, data, error)
+
+    def borrowed_worker():
+        try:
+            borrowed = pool.checkout(timeout=0)
+        except Exception:
+            return  # no spare session (or it failed to start): one worker fewer
+        borrowed.trace = extractor.trace
+        try:
+            drain(borrowed)
+        finally:
+            pool.checkin(borrowed)
+
+    extra = workers - 1 if pool is not None else 0
+    with ThreadPoolExecutor(max_workers=extra + 1) as executor:
+        futures = [executor.submit(borrowed_worker) for _ in range(extra)]
+        futures.append(executor.submit(drain, extractor))
+        for future in futures:
+            future.result()
+
+
+def _scrape_with_processes(urls, workers, report, trace=None):
+    """
+    Scrape on worker processes, pacing them all through this process's limiter.
+    Workers push each profile onto a results queue as it is scraped, so report() streams.
+    The driver pool lives in this process, so every call starts and logs in a fresh Chrome
+    per worker; login needs stored cookies, a spawned worker cannot wait for a captcha.
+    """
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager:
+        requests = manager.Queue()
+        replies = [manager.Queue() for _ in range(workers)]
+        results = manager.Queue()
+        broker = threading.Thread(target=serve_limiter, args=(limiter, requests, replies), name="limiter-broker",
+                                  daemon=True)
+        broker.start()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = [
+                    executor.submit(_scrape_partition, chunk,
+                                    os.path.join(config.COOKIES_DIR, f"process_worker_{n + 1}.json"),
+                                    RemoteLimiter(requests, replies[n], n), results)
+                    for n, chunk in enumerate(partition(urls, workers))
+                ]
+                remaining = len(urls)
+                while remaining:
+                    try:
+                        index, data, error = results.get(timeout=1)
+                    except queue.Empty:
+                        # a worker that died leaves its urls unreported; future.result() raises below
+                        if all(future.done() for future in futures) and results.empty():
+                            break
+                        continue
+                    report(index, data, error)
+                    remaining -= 1
+                for future in futures:
+                    timings = future.result()
+                    if trace is not None:
+                        trace.merge(timings)
+        finally:
+            requests.put(None)
+            broker.join()
+
+
+def _scrape_partition(chunk, cookies_file, shared, results):
+    """Scrape chunk in a worker process, putting (index, data, error) on results per profile"""
+    from MoroccoLinkedInProfileExtractor import MoroccoLinkedInProfileExtractor
+
+    extractor = MoroccoLinkedInProfileExtractor()
+    extractor.trace = JobTrace()
+    budget = worker_budget()
+    try:
+        try:
+            started = extractor.start_session(cookies_file)
+            error = None if started else "LinkedIn login failed"
+        except Exception as e:  # includes EOFError from the captcha prompt: workers have no stdin
+            error = f"LinkedIn login failed: {e}"
+        if error is not None:
+            for index, _ in chunk:
+                results.put((index, None, error))
+            return extractor.trace.summary()
+        for index, url in chunk:
+            try:
+                results.put((index, paced_scrape(extractor, url, budget, shared), None))
+            except Exception as e:
+                results.put((index, None, str(e)))
+    finally:
+        extractor.close()
+    return extractor.trace.summary()
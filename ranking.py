@@ -0,0 +1,128 @@
+"""
+BM25 relevance ranking of scraped profiles against a project description
+"""
+
+import threading
+from bootstrap import lazy_import
+from keywords import rank_keywords, tokenize
+import config
+
+np = lazy_import("numpy")
+
+
+def profile_text(data):
+    """Experiences, about and skills-like text (interests, accomplishments) of a profile"""
+    profile = data.get("profile", {})
+    parts = [profile.get("about")]
+    for exp in data.get("experiences", []):
+        parts += [exp.get("title"), exp.get("description")]
+    parts += data.get("interests", [])
+    parts += [acc.get("title") for acc in data.get("accomplishments", [])]
+    return " ".join(str(part) for part in parts if part and part != "N/A")
+
+
+class BM25Index:
+    """
+    Term/document matrix kept in CSC form (per-term slices of document ids and
+    precomputed BM25 weights), so scoring a query is a few numpy gathers and one bincount.
+    """
+
+    def __init__(self, profiles, k1=None, b=None):
+        k1 = config.RANKING_K1 if k1 is None else k1
+        b = config.RANKING_B if b is None else b
+        self.profiles = profiles
+        self.vocabulary = {}
+        doc_ids, term_ids = [], []
+        for doc_id, data in enumerate(profiles):
+            for token in tokenize(profile_text(data)):
+                doc_ids.append(doc_id)
+                term_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+
+        n_docs, n_terms = len(profiles), len(self.vocabulary)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+
+        # collapse repeated (doc, term) pairs into term frequencies
+        pairs, tf = np.unique(doc_ids * max(n_terms, 1) + term_ids, return_counts=True)
+        pair_docs, pair_terms = pairs // max(n_terms, 1), pairs % max(n_terms, 1)
+
+        doc_len = np.bincount(doc_ids, minlength=n_docs).astype(np.float64)
+        avg_len = doc_len.mean() if n_docs and doc_len.mean() > 0 else 1.0
+        df = np.bincount(pair_terms, minlength=n_terms).astype(np.float64)
+        self.idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+        norm = k1 * (1 - b + b * doc_len[pair_docs] / avg_len)
+        weights = self.idf[pair_terms] * tf * (k1 + 1) / (tf + norm)
+
+        order = np.argsort(pair_terms, kind="stable")
+        self._col_ptr = np.concatenate(([0], np.cumsum(np.bincount(pair_terms, minlength=n_terms))))
+        self._col_docs = pair_docs[order]
+        self._col_weights = weights[order]
+
+    def idf_map(self):
+        return {term: float(self.idf[term_id]) for term, term_id in self.vocabulary.items()}
+
+    def _postings(self, term_id):
+        start, end = self._col_ptr[term_id], self._col_ptr[term_id + 1]
+        return self._col_docs[start:end], self._col_weights[start:end]
+
+    def score(self, terms):
+        """BM25 score of every document for the query terms, and the term ids that matched"""
+        term_ids = [self.vocabulary[term] for term in dict.fromkeys(terms) if term in self.vocabulary]
+        if not term_ids or not self.profiles:
+            return np.zeros(len(self.profiles)), term_ids
+        postings = [self._postings(term_id) for term_id in term_ids]
+        docs = np.concatenate([p[0] for p in postings])
+        weights = np.concatenate([p[1] for p in postings])
+        return np.bincount(docs, weights=weights, minlength=len(self.profiles)), term_ids
+
+    def rank(self, description, limit=None):
+        """Profiles sorted by match score, with each query term's contribution"""
+        terms = tokenize(description)
+        scores, term_ids = self.score(terms)
+        limit = limit or len(self.profiles)
+        top = np.argsort(-scores, kind="stable")[:limit]
+        top = top[scores[top] > 0]
+
+        explanations = {int(doc): {} for doc in top}
+        matched = set(term_ids)
+        inverse = {term_id: term for term, term_id in self.vocabulary.items() if term_id in matched}
+        for term_id in term_ids:
+            docs, weights = self._postings(term_id)
+            hits = np.isin(docs, top)
+            for doc, weight in zip(docs[hits], weights[hits]):
+                explanations[int(doc)][inverse[term_id]] = round(float(weight), 4)
+
+        return [{
+            'url': self.profiles[doc]['url'],
+            'score': round(float(scores[doc]), 4),
+            'matched_terms': explanations[int(doc)],
+            'profile': self.profiles[doc]
+        } for doc in top]
+
+    def keywords(self, description, limit=10):
+        """Description keywords weighted by their idf over the indexed profiles"""
+        return rank_keywords(description, limit, idf=self.idf_map())
+
+
+class StoreRanker:
+    """Keeps a BM25 index over every stored profile, rebuilt only when the store changes"""
+
+    def __init__(self, store):
+        self.store = store
+        self._index = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def index(self):
+        with self._lock:
+            version = self.store.version()
+            if self._index is None or version != self._version:
+                self._index = BM25Index([data for _, data in self.store.iter_profiles()])
+                self._version = version
+            return self._index
+
+    def rank(self, description, limit=None, job_id=None):
+        if job_id:
+            return BM25Index(self.store.job_profiles(job_id)).rank(description, limit)
+        return self.index().rank(description, limit)
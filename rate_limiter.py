@@ -0,0 +1,139 @@
+"""
+Token-bucket rate limiting with adaptive pacing for LinkedIn requests
+"""
+
+import logging
+import random
+import threading
+import time
+from metrics import registry
+import config
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_MARKERS = ("/checkpoint", "/authwall", "captcha", "challenge")
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1, jitter=0.0):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Take tokens, sleeping until they are available. Returns the time slept."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait += random.uniform(0, self.jitter / self.rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """Push the next acquire back by `seconds`"""
+        with self._lock:
+            self._refill()
+            self._tokens -= seconds * self.rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket that backs off on throttling signals and speeds up while responses are healthy"""
+
+    def __init__(self, per_minute=None, burst=None, jitter=None, min_per_minute=None, max_per_minute=None):
+        super().__init__((per_minute or config.RATE_LIMIT_PER_MINUTE) / 60,
+                         burst or config.RATE_LIMIT_BURST,
+                         config.RATE_LIMIT_JITTER if jitter is None else jitter)
+        self.min_rate = (min_per_minute or config.RATE_LIMIT_MIN_PER_MINUTE) / 60
+        self.max_rate = (max_per_minute or config.RATE_LIMIT_MAX_PER_MINUTE) / 60
+        self.throttle_events = 0
+
+    def throttled(self, reason=""):
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * config.RATE_LIMIT_BACKOFF)
+            self.throttle_events += 1
+        registry.inc('linkedin_captcha_events_total', reason=reason or "unknown")
+        self.pause(config.RATE_LIMIT_COOLDOWN)
+        logger.warning("Throttling detected (%s), slowing down to %.1f requests/min", reason, self.rate * 60)
+
+    def healthy(self):
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + config.RATE_LIMIT_RECOVERY / 60)
+
+    def observe(self, driver):
+        """Check the current page for captcha/authwall redirects. Returns True when throttled."""
+        return _observe(self, driver)
+
+    def check(self, driver):
+        """observe() for failed loads: backs off on a throttling page, but never speeds up"""
+        return _observe(self, driver, healthy=False)
+
+
+def _observe(limiter, driver, healthy=True):
+    try:
+        location = f"{driver.current_url} {driver.title}".lower()
+    except Exception:
+        return False
+    for marker in THROTTLE_MARKERS:
+        if marker in location:
+            limiter.throttled(marker)
+            return True
+    if healthy:
+        limiter.healthy()
+    return False
+
+
+class RemoteLimiter:
+    """
+    The shared limiter as seen from a worker process: every call is forwarded to
+    serve_limiter() in the parent, so process workers draw on the same budget
+    and their throttling signals slow everyone down
+    """
+
+    def __init__(self, requests, replies, worker):
+        self._requests = requests
+        self._replies = replies
+        self._worker = worker
+
+    def _call(self, method, *args):
+        self._requests.put((self._worker, method, args))
+        return self._replies.get()
+
+    def acquire(self, tokens=1):
+        return self._call("acquire", tokens)
+
+    def throttled(self, reason=""):
+        self._call("throttled", reason)
+
+    def healthy(self):
+        self._call("healthy")
+
+    def observe(self, driver):
+        return _observe(self, driver)
+
+    def check(self, driver):
+        return _observe(self, driver, healthy=False)
+
+
+def serve_limiter(limiter, requests, replies):
+    """Answer RemoteLimiter calls from requests until a None arrives; replies[worker] gets each result"""
+    while True:
+        call = requests.get()
+        if call is None:
+            return
+        worker, method, args = call
+        replies[worker].put(getattr(limiter, method)(*args))
+
+
+limiter = AdaptiveRateLimiter()
@@ -0,0 +1,213 @@
+"""
+SQLite result store for jobs, URL lists and profiles, with full-text search
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from url_index import canonicalize_profile_url
+import config
+
+SEARCH_COLUMNS = ("name", "location", "about", "companies", "skills")
+
+
+def _fts5_available(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _fts_phrase(column, value):
+    """`column : "value"*` with the value quoted so user input cannot inject FTS syntax"""
+    return f'{column} : "{value.replace(chr(34), chr(34) * 2)}"*'
+
+
+def profile_search_fields(data):
+    profile = data.get("profile", {})
+    experiences = data.get("experiences", [])
+    skills = [profile.get("about")]
+    skills += [f"{exp.get('title')} {exp.get('description')}" for exp in experiences]
+    skills += data.get("interests", [])
+    skills += [acc.get("title") for acc in data.get("accomplishments", [])]
+    return {
+        "name": profile.get("name") or "",
+        "location": profile.get("location") or "",
+        "about": profile.get("about") or "",
+        "companies": " | ".join(exp.get("company") or "" for exp in experiences),
+        "skills": " ".join(str(text) for text in skills if text and text != "N/A")
+    }
+
+
+class ResultStore:
+    def __init__(self, path=None):
+        self.path = path or config.RESULT_STORE_PATH
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                description TEXT,
+                status TEXT NOT NULL,
+                created_at REAL,
+                finished_at REAL,
+                profiles_file TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_finished_at ON jobs (finished_at);
+            CREATE TABLE IF NOT EXISTS job_urls (
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (job_id, position)
+            );
+            CREATE TABLE IF NOT EXISTS profiles (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                name TEXT,
+                location TEXT,
+                about TEXT,
+                companies TEXT,
+                skills TEXT,
+                open_to_work INTEGER,
+                updated_at REAL NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS profiles_updated_at ON profiles (updated_at);
+            CREATE TABLE IF NOT EXISTS job_profiles (
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                profile_id INTEGER NOT NULL,
+                PRIMARY KEY (job_id, position)
+            );
+        """)
+        self.fts = _fts5_available(self._conn)
+        if self.fts:
+            self._conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5({', '.join(SEARCH_COLUMNS)})")
+        self._conn.commit()
+
+    def save_job(self, job):
+        with self._lock:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO jobs (id, description, status, created_at, finished_at, profiles_file, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (job['id'], job['description_project'], job['current_phase'], job['created_at'],
+                  job.get('finished_at'), job.get('latest_file'), json.dumps(job, ensure_ascii=False, default=str)))
+            self._conn.commit()
+
+    def get_job(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def latest_job(self):
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT data FROM jobs WHERE finished_at IS NOT NULL AND status = 'done' AND profiles_file IS NOT NULL
+                ORDER BY finished_at DESC LIMIT 1
+            """).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def save_urls(self, job_id, urls):
+        with self._lock:
+            self._conn.execute("DELETE FROM job_urls WHERE job_id = ?", (job_id,))
+            self._conn.executemany("INSERT INTO job_urls (job_id, position, url) VALUES (?, ?, ?)",
+                                   [(job_id, position, url) for position, url in enumerate(urls)])
+            self._conn.commit()
+
+    def add_profile(self, job_id, position, data):
+        """Insert or refresh a profile and attach it to the job at `position`"""
+        url = canonicalize_profile_url(data['url']) or data['url']
+        fields = profile_search_fields(data)
+        open_to_work = data.get("profile", {}).get("open_to_work")
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM profiles WHERE url = ?", (url,)).fetchone()
+            values = (fields['name'], fields['location'], fields['about'], fields['companies'], fields['skills'],
+                      1 if open_to_work is True else 0, time.time(), json.dumps(data, ensure_ascii=False))
+            if row:
+                profile_id = row['id']
+                self._conn.execute("""
+                    UPDATE profiles SET name = ?, location = ?, about = ?, companies = ?, skills = ?,
+                    open_to_work = ?, updated_at = ?, data = ? WHERE id = ?
+                """, values + (profile_id,))
+                if self.fts:
+                    self._conn.execute("DELETE FROM profiles_fts WHERE rowid = ?", (profile_id,))
+            else:
+                profile_id = self._conn.execute("""
+                    INSERT INTO profiles (url, name, location, about, companies, skills, open_to_work, updated_at, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (url,) + values).lastrowid
+            if self.fts:
+                self._conn.execute(f"INSERT INTO profiles_fts (rowid, {', '.join(SEARCH_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                                   (profile_id,) + tuple(fields[column] for column in SEARCH_COLUMNS))
+            self._conn.execute("INSERT OR REPLACE INTO job_profiles (job_id, position, profile_id) VALUES (?, ?, ?)",
+                               (job_id, position, profile_id))
+            self._conn.commit()
+        return profile_id
+
+    def job_profiles(self, job_id):
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT p.data FROM job_profiles j JOIN profiles p ON p.id = j.profile_id
+                WHERE j.job_id = ? ORDER BY j.position
+            """, (job_id,)).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def iter_profiles(self):
+        """(url, data) for every stored profile, newest first"""
+        with self._lock:
+            rows = self._conn.execute("SELECT url, data FROM profiles ORDER BY updated_at DESC").fetchall()
+        for row in rows:
+            yield row['url'], json.loads(row['data'])
+
+    def version(self):
+        """Changes whenever a profile is added or refreshed"""
+        with self._lock:
+            return tuple(self._conn.execute("SELECT COUNT(*), MAX(updated_at) FROM profiles").fetchone())
+
+    def search(self, location=None, skills=None, company=None, open_to_work=None, page=1, per_page=20):
+        """
+        Profiles matching every given filter, newest first.
+        skills is a list of terms that must all appear in about/experiences/interests.
+        """
+        terms = []
+        if location:
+            terms.append(("location", location))
+        for skill in skills or []:
+            terms.append(("skills", skill))
+        if company:
+            terms.append(("companies", company))
+
+        joins, where, params = "", [], []
+        if terms and self.fts:
+            joins = "JOIN profiles_fts f ON f.rowid = p.id"
+            where.append("profiles_fts MATCH ?")
+            params.append(" AND ".join(_fts_phrase(column, value) for column, value in terms))
+        else:
+            for column, value in terms:
+                where.append(f"p.{column} LIKE ?")
+                params.append(f"%{value}%")
+        if open_to_work is not None:
+            where.append("p.open_to_work = ?")
+            params.append(1 if open_to_work else 0)
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM profiles p {joins} {where_sql}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT p.data FROM profiles p {joins} {where_sql} ORDER BY p.updated_at DESC LIMIT ? OFFSET ?",
+                params + [per_page, (page - 1) * per_page]
+            ).fetchall()
+        return {
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'results': [json.loads(row['data']) for row in rows]
+        }
@@ -0,0 +1,75 @@
+"""
+Incremental NDJSON writer for scraped profiles
+"""
+
+import json
+import os
+import threading
+
+
+class ResultWriter:
+    """
+    Appends each profile to an NDJSON file as soon as it is scraped, so results never
+    have to be held in memory. finalize() merges them back into URL order as a JSON array.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._offsets = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._index_existing()
+        self._file = open(path, 'ab')
+
+    def _index_existing(self):
+        """Pick up the records of a resumed job, dropping a half-written last line"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb+') as f:
+            offset = 0
+            for line in iter(f.readline, b''):
+                if not line.endswith(b"\n"):
+                    f.truncate(offset)
+                    break
+                self._offsets[json.loads(line)["index"]] = offset
+                offset += len(line)
+        self.count = len(self._offsets)
+
+    def append(self, index, data):
+        line = (json.dumps({"index": index, "profile": data}, ensure_ascii=False) + "\n").encode('utf-8')
+        with self._lock:
+            self._offsets[index] = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            self.count = len(self._offsets)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def finalize(self, json_path):
+        """Write the profiles as a JSON array ordered by index, one line at a time"""
+        self.close()
+        with open(self.path, 'rb') as src, open(json_path, 'w', encoding='utf-8') as out:
+            out.write("[\n")
+            for n, index in enumerate(sorted(self._offsets)):
+                src.seek(self._offsets[index])
+                record = json.loads(src.readline())
+                if n:
+                    out.write(",\n")
+                out.write(json.dumps(record["profile"], ensure_ascii=False))
+            out.write("\n]\n")
+        return self.count
+
+
+def read_records(path):
+    """Yield the {"index", "profile"} records of an NDJSON result file"""
+    if not path or not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            # the last line may still be half-written by a running job
+            if line.endswith("\n") and line.strip():
+                yield json.loads(line)
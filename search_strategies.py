@@ -0,0 +1,62 @@
+"""
+LinkedIn people-search strategies and their historical yield
+"""
+
+import json
+import os
+import threading
+from urllib.parse import quote
+import config
+
+GEO_MOROCCO = "geoUrn=%5B%22102787409%22%5D"
+STRATEGY_SUFFIXES = ["", "Morocco", "Maroc", "Casablanca", "Rabat", "Marrakech"]
+
+
+def build_search_strategies(keywords):
+    """(name, url) pairs for every search strategy, in their default order"""
+    search_query = quote(" ".join(keywords))
+    strategies = []
+    for suffix in STRATEGY_SUFFIXES:
+        query = f"{search_query}%20{suffix}" if suffix else search_query
+        strategies.append((suffix or "base", f"{config.LINKEDIN_BASE_URL}/search/results/people/?keywords={query}&{GEO_MOROCCO}"))
+    return strategies
+
+
+class StrategyStats:
+    """Average number of new profiles each strategy has produced, persisted between runs"""
+
+    def __init__(self, path=None):
+        self.path = path or config.STRATEGY_STATS_PATH
+        self._lock = threading.Lock()
+        self._stats = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._stats = json.load(f)
+            except (OSError, ValueError):
+                self._stats = {}
+
+    def average_yield(self, name):
+        stats = self._stats.get(name)
+        if not stats or not stats['runs']:
+            return float('inf')  # untried strategies go first
+        return stats['profiles'] / stats['runs']
+
+    def ordered(self, strategies):
+        """Highest historical yield first; ties keep the default order"""
+        with self._lock:
+            return sorted(strategies, key=lambda strategy: -self.average_yield(strategy[0]))
+
+    def record(self, name, profiles_found):
+        with self._lock:
+            stats = self._stats.setdefault(name, {'runs': 0, 'profiles': 0})
+            stats['runs'] += 1
+            stats['profiles'] += profiles_found
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._stats, f, indent=4)
+            os.replace(tmp_path, self.path)
+
+
+strategy_stats = StrategyStats()
@@ -0,0 +1,136 @@
+"""
+Profile URL canonicalization and O(1) deduplication indexes
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import unquote, urlsplit, parse_qs
+import config
+
+MEMBER_URN = re.compile(r"(?:urn:li:(?:fs_miniProfile|fsd_profile|fs_profile|member):)?(ACo[A-Za-z0-9_-]{10,})")
+URN_QUERY_PARAMS = ("miniProfileUrn", "profileUrn")
+
+
+def _linkedin_host():
+    """Scheme and host of config.LINKEDIN_BASE_URL (www.linkedin.com, or a local stand-in)"""
+    return config.LINKEDIN_BASE_URL.rstrip('/')
+
+
+def _is_linkedin_netloc(netloc):
+    netloc = netloc.lower()
+    return netloc == "linkedin.com" or netloc.endswith(".linkedin.com") or netloc == urlsplit(_linkedin_host()).netloc.lower()
+
+
+def canonicalize_profile_url(url):
+    """
+    https://ma.linkedin.com/in/John-Doe/?trk=abc -> https://www.linkedin.com/in/john-doe
+    /in/ACoAAB12...?miniProfileUrn=... -> https://www.linkedin.com/in/ACoAAB12...
+    Returns None for anything that is not a member profile URL.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    if parts.netloc and not _is_linkedin_netloc(parts.netloc):
+        return None
+    segments = [segment for segment in unquote(parts.path).split('/') if segment]
+    if len(segments) < 2 or segments[0].lower() != "in":
+        return None
+    slug = segments[1]
+    if not MEMBER_URN.fullmatch(slug):
+        # vanity names are case-insensitive, member URN ids are not
+        slug = slug.lower()
+    return f"{_linkedin_host()}/in/{slug}"
+
+
+def member_urn_url(url):
+    """Canonical /in/<urn id> URL carried in the tracking query (miniProfileUrn=...), if any"""
+    query = parse_qs(urlsplit(url).query)
+    for param in URN_QUERY_PARAMS:
+        for value in query.get(param, []):
+            match = MEMBER_URN.search(unquote(value))
+            if match:
+                return f"{_linkedin_host()}/in/{match.group(1)}"
+    return None
+
+
+def profile_keys(url):
+    """Every canonical key that identifies this profile: the vanity form and, when known, the URN form"""
+    keys = []
+    canonical = canonicalize_profile_url(url)
+    if canonical:
+        keys.append(canonical)
+    urn_url = member_urn_url(url or "")
+    if urn_url and urn_url not in keys:
+        keys.append(urn_url)
+    return keys
+
+
+class UrlIndex:
+    """Per-run set of canonical profile keys, safe to share between threads"""
+
+    def __init__(self):
+        self._keys = set()
+        self._lock = threading.Lock()
+
+    def add(self, url):
+        """Record url; returns False when any of its keys was already seen"""
+        keys = profile_keys(url)
+        if not keys:
+            return False
+        with self._lock:
+            if any(key in self._keys for key in keys):
+                return False
+            self._keys.update(keys)
+        return True
+
+    def __contains__(self, url):
+        return any(key in self._keys for key in profile_keys(url))
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class SeenIndex:
+    """Persistent "already scraped" index shared across jobs"""
+
+    def __init__(self, path=None):
+        self.path = path or config.SEEN_INDEX_PATH
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def __contains__(self, url):
+        keys = profile_keys(url)
+        if not keys:
+            return False
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            row = self._conn.execute(f"SELECT 1 FROM seen_urls WHERE key IN ({placeholders}) LIMIT 1", keys).fetchone()
+        return row is not None
+
+    def add(self, url):
+        now = time.time()
+        canonical = canonicalize_profile_url(url) or url
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO seen_urls (key, url, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen
+            """, [(key, canonical, now, now) for key in profile_keys(url)])
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]